@@ -0,0 +1,69 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+
+def count_plot(data, column: str, palette: str):
+    """Diagramme en barres horizontales du nombre de joueurs par modalité de `column`."""
+    fig, ax = plt.subplots()
+    sns.countplot(y=column, data=data, order=data[column].value_counts().index,
+                  palette=palette, hue=column, legend=False, ax=ax)
+    return fig
+
+
+def radar_chart(labels, series, title: str, figsize=(6, 6), alpha: float = 0.25, title_size=None, legend=False):
+    """
+    Diagramme radar. Chaque série est un dict :
+    - values : valeurs tracées (une par label)
+    - annotations : valeurs affichées au-dessus de chaque point
+    - color ; label et text_color optionnels
+    """
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
+    angles += angles[:1]
+
+    fig, ax = plt.subplots(figsize=figsize, subplot_kw=dict(polar=True))
+    for s in series:
+        values = list(s["values"]) + [s["values"][0]]
+        ax.plot(angles, values, label=s.get("label"), color=s["color"])
+        ax.fill(angles, values, alpha=alpha, color=s["color"])
+        annotations = list(s["annotations"]) + [s["annotations"][0]]
+        for angle, value, text in zip(angles, values, annotations):
+            ax.text(angle, value + 5, f"{text:.1f}", ha='center', va='center', fontsize=8,
+                    color=s.get("text_color", s["color"]))
+
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(labels)
+    ax.set_yticklabels([])
+    ax.set_title(title, size=title_size)
+    if legend:
+        ax.legend(loc='upper right')
+    return fig
+
+
+def pitch_chart(placed):
+    """Terrain de football avec les joueurs placés [(nom, x, y)]."""
+    fig_field, ax_field = plt.subplots(figsize=(6, 8))
+    fig_field.patch.set_facecolor("#4CAF50")
+
+    ax_field.set_xlim(0, 1)
+    ax_field.set_ylim(0, 1)
+    ax_field.set_facecolor("#4CAF50")
+    ax_field.axis("off")
+
+    # --- DESSIN DES LIGNES DU TERRAIN DE FOOTBALL ---
+    ax_field.plot([0.02, 0.98], [0.02, 0.02], color="white", linewidth=1.5)
+    ax_field.plot([0.02, 0.02], [0.02, 0.5], color="white", linewidth=1.5)
+    ax_field.plot([0.98, 0.98], [0.02, 0.5], color="white", linewidth=1.5)
+    ax_field.plot([0.02, 0.98], [0.5, 0.5], color="white", linewidth=1.5)
+    center_circle = plt.Circle((0.5, 0.5), 0.15, color='white', fill=False, linewidth=1.5)
+    ax_field.add_patch(center_circle)
+
+    ax_field.add_patch(plt.Rectangle((0.15, 0.02), 0.7, 0.16, color='white', fill=False, linewidth=1.5))
+    ax_field.plot(0.5, 0.12, 'o', color='white', markersize=5)
+    # --- FIN DESSIN DES LIGNES DU TERRAIN DE FOOTBALL ---
+
+    for name, x, y in placed:
+        ax_field.plot(x, y, 'o', color='gold', markersize=15, markeredgecolor='black', markeredgewidth=1)
+        ax_field.text(x, y + 0.03, name, color='white', ha='center', va='bottom', fontsize=9, weight='bold',
+                      bbox=dict(facecolor='black', alpha=0.5, edgecolor='none', boxstyle='round,pad=0.2'))
+    return fig_field
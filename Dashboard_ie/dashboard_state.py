@@ -0,0 +1,79 @@
+import os
+
+import streamlit as st
+
+from ie_data import MOVES_COLS, CRITERES
+from ie_service import QueryEngine, serve_in_background
+
+from tracing import span
+
+DATA_FILE = 'IE1.csv'
+
+
+# --- DONNÉES PARTAGÉES ENTRE PAGES, SESSIONS ET API (lecture seule) ---
+@st.cache_resource
+def query_engine(filename: str = DATA_FILE) -> QueryEngine:
+    # Ensure this path is correct for your environment
+    engine = QueryEngine(os.path.join(os.getcwd(), filename))
+    # IE_SERVICE_PORT : expose le même jeu de données chargé via l'API JSON (ie_service.py)
+    port = os.getenv("IE_SERVICE_PORT")
+    if port:
+        serve_in_background(engine, int(port))
+    return engine
+
+
+def load_data(filename: str = DATA_FILE):
+    return query_engine(filename).df
+
+
+def filter_options(filename: str = DATA_FILE) -> dict:
+    return query_engine(filename).options
+
+
+def filtered_players(teams: tuple, positions: tuple, elements: tuple, moves: tuple, crit: str,
+                     filename: str = DATA_FILE):
+    """Effectif filtré + colonne de score, mis en cache par le moteur (ne pas modifier le résultat)."""
+    filters = {'Team': teams, 'Position': positions, 'Element': elements, **dict(moves)}
+    return query_engine(filename).filtered(filters, crit)
+
+
+@st.cache_data(max_entries=4)
+def filtered_csv(teams: tuple, positions: tuple, elements: tuple, moves: tuple, crit: str) -> bytes:
+    filtered, _ = filtered_players(teams, positions, elements, moves, crit)
+    return filtered.to_csv(index=False).encode('utf-8')
+
+
+# --- FILTRES GÉNERAUX (APPLICABLES À TOUTES LES PAGES SAUF L'EXPLORATEUR DE DONNÉES) ---
+def sidebar_filters():
+    """Affiche les filtres généraux et renvoie la sélection sous forme hashable."""
+    options = filter_options()
+    st.sidebar.header("Filtres généraux")
+
+    teams = st.sidebar.multiselect("Équipe", options['Team'], default=options['Team'], key='filter_team')
+    positions = st.sidebar.multiselect("Poste", options['Position'], default=options['Position'], key='filter_position')
+    elements = st.sidebar.multiselect("Élément", options['Element'], default=options['Element'], key='filter_element')
+
+    moves = []
+    for col in MOVES_COLS:
+        selected = st.sidebar.multiselect(f"Sélection {col}", options[col], default=options[col], key=f"filter_{col}")
+        moves.append((col, tuple(selected)))
+
+    # --- SÉLECTION DES CRITÈRES DE TOP (APPLICABLE AUX PAGES DU DASHBOARD) ---
+    crit = st.sidebar.selectbox("Critère de classement", CRITERES, key='filter_crit')
+    st.sidebar.markdown("---") # Séparateur visuel
+
+    return tuple(teams), tuple(positions), tuple(elements), tuple(moves), crit
+
+
+def current_selection():
+    """Sélection courante et effectif filtré, pour les pages du dashboard."""
+    selection = st.session_state['ie_selection']
+    filtered, score_col = filtered_players(*selection)
+    return selection, filtered, score_col
+
+
+@st.cache_resource
+def similarity_index(filename: str = DATA_FILE):
+    from similarity import SimilarityIndex
+    with span("dashboard.similarity_index"):
+        return SimilarityIndex(load_data(filename))
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+# === Colonnes du jeu de données IE1 ===
+STATS_COLS = ['FP', 'TP', 'Kick', 'Body', 'Control', 'Guard', 'Speed', 'Stamina', 'Guts']
+MOVES_COLS = ['1st Move', '2nd Move', '3rd Move', '4th Move']
+CRITERES = STATS_COLS + ['Moyenne']
+
+# Emplacements du terrain (1 GK, 4 DF, 4 MF, 3 FW) en coordonnées normalisées
+POSITION_MAP = {
+    'GK': [(0.5, 0.1)],
+    'DF': [(0.2, 0.3), (0.4, 0.3), (0.6, 0.3), (0.8, 0.3)],
+    'MF': [(0.2, 0.55), (0.4, 0.55), (0.6, 0.55), (0.8, 0.55)],
+    'FW': [(0.3, 0.8), (0.5, 0.8), (0.7, 0.8)]
+}
+POSITION_ORDER = {'GK': 0, 'DF': 1, 'MF': 2, 'FW': 3}
+
+
+def read_roster(path: str) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+def filter_players(df: pd.DataFrame, teams, positions, elements, selected_moves: dict) -> pd.DataFrame:
+    """Applique les filtres généraux en un seul masque booléen (une seule copie)."""
+    mask = (
+        df['Team'].isin(teams) &
+        df['Position'].isin(positions) &
+        df['Element'].isin(elements)
+    )
+    for col, sel in selected_moves.items():
+        mask &= df[col].fillna('').isin(sel)
+    return df[mask].copy()
+
+
+def add_score(filtered: pd.DataFrame, crit: str) -> str:
+    """Ajoute la colonne 'Moyenne' si besoin et renvoie le nom de la colonne de score."""
+    if crit == 'Moyenne':
+        arr = filtered[STATS_COLS].to_numpy(dtype=float)
+        filtered['Moyenne'] = np.ma.masked_invalid(arr).mean(axis=1)
+    return crit
+
+
+def top_players(filtered: pd.DataFrame, score_col: str, n: int = 5) -> pd.DataFrame:
+    return filtered.nlargest(n, score_col)[['Name', 'Team', 'Position', score_col]]
+
+
+def top_teams(filtered: pd.DataFrame, score_col: str, n: int = 5) -> pd.DataFrame:
+    return filtered.groupby('Team')[score_col].mean().nlargest(n).reset_index()
+
+
+def move_counts(filtered: pd.DataFrame, n: int = 10) -> pd.Series:
+    all_moves = pd.concat([filtered[c] for c in MOVES_COLS])
+    return all_moves.value_counts().head(n)
+
+
+def team_profile(filtered: pd.DataFrame, team: str) -> pd.Series:
+    return filtered[filtered['Team'] == team][STATS_COLS].mean()
+
+
+def place_players(team_df: pd.DataFrame):
+    """
+    Attribue à chaque joueur un emplacement libre de son poste.
+    Renvoie (placés [(nom, x, y)], non placés [(nom, poste)]).
+    """
+    order = team_df['Position'].fillna('Unknown').map(POSITION_ORDER)
+    team_df = team_df.assign(Position_Order=order).sort_values(by='Position_Order')
+
+    free_slots = {pos: list(coords) for pos, coords in POSITION_MAP.items()}
+    placed, unplaced = [], []
+    for name, pos in zip(team_df['Name'], team_df['Position']):
+        slots = free_slots.get(pos)
+        if slots:
+            x, y = slots.pop(0)
+            placed.append((name, x, y))
+        else:
+            unplaced.append((name, pos))
+    return placed, unplaced
@@ -0,0 +1,87 @@
+import streamlit as st
+
+from dashboard_state import current_selection, similarity_index
+from ie_data import STATS_COLS, team_profile
+from charts import radar_chart
+from similarity import METRICS
+
+_, filtered, score_col = current_selection()
+stats_cols = STATS_COLS
+
+st.title("Comparaisons de Joueurs et Profils d'Équipes")
+# --- RADARS COMPARATIFS ---
+st.subheader("Diagrammes radar : Comparaisons & Équipe")
+
+col_radar_left, col_radar_right = st.columns(2)
+
+with col_radar_left:
+    st.subheader("🏋️ Comparaison entre deux joueurs")
+    cols_compare = st.columns(2)
+    with cols_compare[0]:
+        joueur1 = st.selectbox("Choisir le joueur 1", sorted(filtered['Name'].unique()), key='joueur1_comp')
+    with cols_compare[1]:
+        joueur2 = st.selectbox("Choisir le joueur 2", sorted(filtered['Name'].unique()), key='joueur2_comp')
+
+    if joueur1 and joueur2:
+        j1_stats = filtered[filtered['Name'] == joueur1][stats_cols].iloc[0]
+        j2_stats = filtered[filtered['Name'] == joueur2][stats_cols].iloc[0]
+
+        fig = radar_chart(stats_cols, [
+            {"values": (j1_stats / 100 * 100).tolist(), "annotations": j1_stats.tolist(),
+             "color": 'green', "label": joueur1},
+            {"values": (j2_stats / 100 * 100).tolist(), "annotations": j2_stats.tolist(),
+             "color": 'red', "label": joueur2},
+        ], f"Comparaison entre {joueur1} et {joueur2}", figsize=(7, 7), alpha=0.2, title_size=13, legend=True)
+        st.pyplot(fig)
+
+with col_radar_right:
+    st.markdown("### Profil d'Équipe")
+    equipes = filtered['Team'].fillna('').unique()
+    eq = st.selectbox("Choisir une équipe pour voir son profil moyen", sorted(equipes), key="equipe_profile")
+
+    if eq:
+        eq_stats = team_profile(filtered, eq)
+        eq_norm = (eq_stats / eq_stats.max()) * 100
+        fig_eq = radar_chart(stats_cols, [
+            {"values": eq_norm.tolist(), "annotations": eq_stats.tolist(), "color": 'blue', "text_color": 'black'},
+        ], f"{eq} – Profil moyen")
+
+        st.pyplot(fig_eq)
+
+# --- JOUEURS SIMILAIRES ---
+st.subheader("🔎 Joueurs les plus similaires")
+col_sim_table, col_sim_radar = st.columns(2)
+
+with col_sim_table:
+    reference = st.selectbox("Joueur de référence", sorted(filtered['Name'].unique()), key='similar_reference')
+    k = st.slider("Nombre de joueurs similaires", 1, 20, 10, key='similar_k')
+    metric = st.radio("Mesure", METRICS, horizontal=True, key='similar_metric',
+                      format_func=lambda m: {'cosine': "Cosinus (profil)", 'euclidean': "Euclidienne (niveau)"}[m])
+
+    index = similarity_index()
+    similar = None
+    if reference:
+        similar = index.similar_players(reference, k, metric, within=filtered)
+        similar = similar.join(filtered[['Team', 'Position']])[['Name', 'Team', 'Position', 'Score']]
+        st.table(similar.reset_index(drop=True))
+
+with col_sim_radar:
+    if similar is not None and len(similar):
+        shown = st.multiselect("Joueurs affichés sur le radar", similar['Name'].tolist(),
+                               default=similar['Name'].tolist()[:2], key='similar_radar')
+        ref_stats = filtered[filtered['Name'] == reference][stats_cols].iloc[0]
+        colors = ['red', 'blue', 'orange', 'purple', 'brown', 'magenta']
+        series = [{"values": ref_stats.tolist(), "annotations": ref_stats.tolist(), "color": 'green', "label": reference}]
+        for i, name in enumerate(shown):
+            label = similar.index[similar['Name'] == name][0]
+            player_stats = filtered.loc[label, stats_cols]
+            series.append({"values": player_stats.tolist(), "annotations": player_stats.tolist(),
+                           "color": colors[i % len(colors)], "label": name})
+        st.pyplot(radar_chart(stats_cols, series, f"{reference} et joueurs similaires", figsize=(7, 7),
+                              alpha=0.15, title_size=13, legend=True))
+
+# --- EXPORT DE LA TABLE DE SIMILARITÉ (tous les joueurs filtrés) ---
+if st.button("Calculer la table de similarité de l'effectif filtré", key='similar_export'):
+    table = index.similarity_table(k, metric, within=filtered)
+    st.download_button("Télécharger la table de similarité", table.to_csv(index=False).encode('utf-8'),
+                       "similarite_IE1.csv", "text/csv")
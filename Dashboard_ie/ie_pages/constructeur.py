@@ -0,0 +1,80 @@
+import streamlit as st
+
+from dashboard_state import current_selection, filtered_csv
+from ie_data import STATS_COLS, place_players
+from lineup import best_lineup
+from charts import pitch_chart, radar_chart
+
+selection, filtered, score_col = current_selection()
+stats_cols = STATS_COLS
+
+st.title("Constructeur d'Équipe Personnalisée")
+
+# --- COMPOSITION AUTOMATIQUE DU MEILLEUR XI ---
+with st.expander(f"⚡ Composer automatiquement la meilleure équipe selon **{score_col}**"):
+    col_team_cap, col_element_cap = st.columns(2)
+    with col_team_cap:
+        st.number_input("Joueurs max. par équipe (0 = sans limite)", 0, 12, 0, key='lineup_max_team')
+    with col_element_cap:
+        st.number_input("Joueurs max. par élément (0 = sans limite)", 0, 12, 0, key='lineup_max_element')
+
+    def compose_lineup():
+        # Plafonds lus au moment du clic, depuis l'état des widgets
+        lineup, exact = best_lineup(filtered, score_col, st.session_state.get('lineup_max_team', 0),
+                                    st.session_state.get('lineup_max_element', 0))
+        st.session_state['custom_team_builder'] = lineup.index.tolist()
+        st.session_state['lineup_exact'] = exact
+
+    st.button("Composer l'équipe", on_click=compose_lineup, key='lineup_compose')
+    if st.session_state.get('lineup_exact') is False:
+        st.info("scipy n'est pas installé ou les contraintes sont impossibles : composition gloutonne, optimum non garanti.")
+
+# --- RADAR ÉQUIPE PERSONNALISÉE ---
+# La sélection porte sur les lignes (index) et non sur les noms : deux joueurs homonymes restent distincts
+player_names = filtered['Name']
+homonyms = set(player_names[player_names.duplicated(keep=False)])
+
+
+def player_label(row) -> str:
+    name = player_names[row]
+    return f"{name} ({filtered.at[row, 'Team']})" if name in homonyms else name
+
+
+# Les joueurs exclus par un changement de filtres sont retirés de la sélection
+if 'custom_team_builder' in st.session_state:
+    st.session_state['custom_team_builder'] = [row for row in st.session_state['custom_team_builder']
+                                               if row in filtered.index]
+
+joueurs_select = st.multiselect("Choisir plusieurs joueurs pour créer une équipe personnalisée",
+                                player_names.sort_values().index.tolist(), format_func=player_label,
+                                key="custom_team_builder")
+
+col_team_vis, col_team_radar = st.columns(2)
+
+with col_team_vis:
+    if joueurs_select:
+        st.markdown("### Position des joueurs sur le terrain")
+
+        team_df = filtered.loc[joueurs_select]
+        placed, unplaced = place_players(team_df)
+        for name, pos in unplaced:
+            st.warning(
+                f"Impossible de placer le joueur {name} ({pos}). Il n'y a plus de place disponible pour ce poste ou le poste est inconnu.")
+
+        st.pyplot(pitch_chart(placed))
+
+with col_team_radar:
+    if joueurs_select:
+        team_df = filtered.loc[joueurs_select]
+        team_stats = team_df[stats_cols].mean()
+        team_norm = (team_stats / team_stats.max()) * 100
+
+        fig_custom = radar_chart(stats_cols, [
+            {"values": team_norm.tolist(), "annotations": team_stats.tolist(), "color": "purple"},
+        ], "Équipe personnalisée – Profil moyen")
+
+        st.pyplot(fig_custom)
+
+# --- EXPORT CSV FILTRÉ (mis en cache par sélection de filtres) ---
+st.sidebar.markdown("### 📅 Exporter les Données Filtrées")
+st.sidebar.download_button("Télécharger CSV", filtered_csv(*selection), "filtered_IE1.csv", "text/csv")
@@ -0,0 +1,39 @@
+import streamlit as st
+
+from dashboard_state import load_data, filter_options
+
+df = load_data()
+options = filter_options()
+
+st.title("Explorateur de Données")
+st.subheader("Filtrer et explorer toutes les données des joueurs")
+
+# Filters for the Data Explorer
+explorer_teams = st.multiselect(
+    "Filtrer par équipe",
+    options['Team'],
+    key='explorer_teams_filter'
+)
+explorer_names = st.multiselect(
+    "Filtrer par nom de joueur",
+    options['Name'],
+    key='explorer_names_filter'
+)
+
+explorer_filtered_df = df
+
+if explorer_teams:
+    explorer_filtered_df = explorer_filtered_df[explorer_filtered_df['Team'].fillna('').isin(explorer_teams)]
+if explorer_names:
+    explorer_filtered_df = explorer_filtered_df[explorer_filtered_df['Name'].isin(explorer_names)]
+
+st.write(f"Affichage de **{len(explorer_filtered_df)}** joueurs sur **{len(df)}**")
+st.dataframe(explorer_filtered_df)
+
+csv_explorer = explorer_filtered_df.to_csv(index=False).encode('utf-16')
+st.download_button(
+    label="Télécharger les données filtrées",
+    data=csv_explorer,
+    file_name="explored_IE1_data.csv",
+    mime="text/csv",
+)
@@ -0,0 +1,37 @@
+import streamlit as st
+
+from dashboard_state import current_selection
+from ie_data import top_players, top_teams, move_counts
+from charts import count_plot
+from tracing import span
+
+_, filtered, score_col = current_selection()
+
+st.title("Statistiques et Techniques Générales")
+# --- TOP 5 JOUEURS ---
+st.subheader(f"Top 5 joueurs selon **{score_col}**")
+with span("dashboard.rank_players", rows=len(filtered)):
+    top5_joueurs = top_players(filtered, score_col)
+st.table(top5_joueurs)
+
+# --- TOP 5 ÉQUIPES ---
+st.subheader(f"Top 5 équipes selon moyenne de **{score_col}**")
+with span("dashboard.rank_teams", rows=len(filtered)):
+    top5_equipes = top_teams(filtered, score_col)
+st.table(top5_equipes)
+
+# --- UTILISATION TECHNIQUE ---
+st.subheader("Techniques les plus utilisées")
+with span("dashboard.move_counts", rows=len(filtered)):
+    top_moves = move_counts(filtered)
+st.bar_chart(top_moves)
+
+# --- VISUALISATIONS ---
+col1, col2 = st.columns(2)
+with col1, span("dashboard.plot_positions"):
+    st.subheader("Répartition par Postes")
+    st.pyplot(count_plot(filtered, 'Position', 'viridis'))
+with col2, span("dashboard.plot_elements"):
+    st.subheader("Répartition par Éléments")
+    st.pyplot(count_plot(filtered, 'Element', 'coolwarm'))
+
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+if __name__ == "__main__":
+    # Lancé directement : le module tracing est à la racine du dépôt
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ie_data import (STATS_COLS, MOVES_COLS, CRITERES, read_roster, filter_players, add_score,
+                     top_players, top_teams, move_counts, team_profile)
+from tracing import span
+
+DEFAULT_PORT = 8601
+OPERATIONS = ['count', 'top_players', 'top_teams', 'move_counts', 'team_profile']
+FILTER_FIELDS = ['Team', 'Position', 'Element'] + MOVES_COLS
+
+
+def _records(frame: pd.DataFrame) -> list:
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient='records')
+
+
+class QueryEngine:
+    """
+    Moteur de filtres et classements du dashboard, sans Streamlit :
+    - Le CSV est chargé une seule fois et partagé par tous les appels
+    - Les requêtes sont normalisées puis mises en cache (LRU) sur leur forme normalisée
+    Une requête est un dict : {"op": ..., "filters": {colonne: [valeurs]}, "crit": ..., "n": ..., "team": ...}.
+    Un filtre absent vaut "toutes les valeurs", comme la sélection par défaut du dashboard.
+    """
+
+    def __init__(self, path: str, cache_size: int = 1024, filter_cache_size: int = 32):
+        self.path = path
+        with span("service.load_data", file=path):
+            self.df = read_roster(path)
+        self.options = {col: sorted(self.df[col].fillna('').unique()) for col in ['Team', 'Position', 'Element']}
+        self.options['Name'] = sorted(self.df['Name'].unique())
+        for col in MOVES_COLS:
+            self.options[col] = sorted(self.df[col].dropna().unique())
+        self._filtered = lru_cache(maxsize=filter_cache_size)(self._compute_filtered)
+        self._answer = lru_cache(maxsize=cache_size)(self._compute_answer)
+
+    # === Normalisation ===
+    def normalize_filters(self, filters: dict = None, crit: str = 'Moyenne') -> tuple:
+        filters = filters or {}
+        if not isinstance(filters, dict):
+            raise ValueError("'filters' doit être un objet {colonne: [valeurs]}")
+        unknown = set(filters) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Filtres inconnus : {sorted(unknown)}")
+        if crit not in CRITERES:
+            raise ValueError(f"Critère inconnu : {crit}")
+        values = []
+        for col in FILTER_FIELDS:
+            selected = filters.get(col)
+            if selected is not None and not isinstance(selected, (list, tuple)):
+                # Une chaîne seule deviendrait un ensemble de caractères
+                raise ValueError(f"Le filtre {col} doit être une liste de valeurs")
+            values.append(tuple(self.options[col] if selected is None else sorted(set(selected))))
+        return tuple(values), crit
+
+    def normalize(self, query: dict) -> str:
+        if not isinstance(query, dict):
+            raise ValueError("Une requête doit être un objet JSON")
+        op = query.get('op', 'top_players')
+        if op not in OPERATIONS:
+            raise ValueError(f"Opération inconnue : {op}")
+        filters, crit = self.normalize_filters(query.get('filters'), query.get('crit', 'Moyenne'))
+        normalized = {'op': op, 'filters': filters, 'crit': crit}
+        if op in ('top_players', 'top_teams', 'move_counts'):
+            normalized['n'] = int(query.get('n', 10 if op == 'move_counts' else 5))
+            if normalized['n'] < 1:
+                raise ValueError(f"'n' doit être au moins 1 : {normalized['n']}")
+        if op == 'team_profile':
+            normalized['team'] = query.get('team', '')
+            if not isinstance(normalized['team'], str):
+                raise ValueError("'team' doit être un nom d'équipe (chaîne)")
+        return json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+    # === Calcul ===
+    def _compute_filtered(self, filters: tuple, crit: str):
+        teams, positions, elements, *moves = filters
+        with span("service.filter", rows=len(self.df)) as filter_span:
+            filtered = filter_players(self.df, teams, positions, elements, dict(zip(MOVES_COLS, moves)))
+            score_col = add_score(filtered, crit)
+            filter_span.set("rows_out", len(filtered))
+        return filtered, score_col
+
+    def filtered(self, filters: dict = None, crit: str = 'Moyenne'):
+        """Effectif filtré et colonne de score (objet partagé : ne pas le modifier)."""
+        return self._filtered(*self.normalize_filters(filters, crit))
+
+    def _compute_answer(self, key: str):
+        query = json.loads(key)
+        filters = tuple(tuple(values) for values in query['filters'])
+        filtered, score_col = self._filtered(filters, query['crit'])
+        op = query['op']
+        with span(f"service.{op}", rows=len(filtered)):
+            if op == 'count':
+                return {'count': len(filtered)}
+            if op == 'top_players':
+                return _records(top_players(filtered, score_col, query['n']))
+            if op == 'top_teams':
+                return _records(top_teams(filtered, score_col, query['n']))
+            if op == 'move_counts':
+                return {move: int(count) for move, count in move_counts(filtered, query['n']).items()}
+            profile = team_profile(filtered, query['team'])
+            return {col: (None if pd.isna(profile[col]) else float(profile[col])) for col in STATS_COLS}
+
+    def query(self, query: dict):
+        return self._answer(self.normalize(query))
+
+    def batch(self, queries: list) -> list:
+        results = []
+        for query in queries:
+            try:
+                results.append({'result': self.query(query)})
+            except (ValueError, TypeError) as e:
+                results.append({'error': str(e)})
+        return results
+
+    def cache_info(self) -> dict:
+        return {'responses': self._answer.cache_info()._asdict(), 'filters': self._filtered.cache_info()._asdict()}
+
+
+# === API HTTP/JSON locale ===
+def make_server(engine: QueryEngine, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {'status': 'ok', 'rows': len(engine.df), 'cache': engine.cache_info()})
+            elif self.path == "/options":
+                self._send(200, engine.options)
+            else:
+                self._send(404, {'error': f"Route inconnue : {self.path}"})
+
+        def do_POST(self):
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if self.path == "/query":
+                    self._send(200, {'result': engine.query(payload)})
+                elif self.path == "/batch":
+                    queries = payload.get('queries', []) if isinstance(payload, dict) else None
+                    if not isinstance(queries, list):
+                        raise ValueError("Le corps doit être {\"queries\": [requêtes]}")
+                    self._send(200, {'results': engine.batch(queries)})
+                else:
+                    self._send(404, {'error': f"Route inconnue : {self.path}"})
+            except (ValueError, TypeError) as e:
+                self._send(400, {'error': str(e)})
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve_in_background(engine: QueryEngine, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Démarre l'API dans un thread du processus courant (ex. le serveur Streamlit)."""
+    server = make_server(engine, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[SERVICE] API IE1 sur http://{host}:{server.server_port}")
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API JSON des filtres et classements IE1.")
+    parser.add_argument("--csv", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "IE1.csv"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    server = make_server(QueryEngine(args.csv), args.host, args.port)
+    print(f"[SERVICE] API IE1 sur http://{args.host}:{args.port} (POST /query, POST /batch, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+from ie_data import POSITION_MAP, POSITION_ORDER
+
+try:
+    from scipy.optimize import milp, LinearConstraint, Bounds
+    from scipy.sparse import csr_matrix
+except ImportError:  # scipy est optionnel : sans lui, les contraintes sont traitées de façon gloutonne
+    milp = None
+
+# Nombre de joueurs par poste, d'après les emplacements du terrain
+FORMATION = {pos: len(slots) for pos, slots in POSITION_MAP.items()}
+
+
+def _candidates(filtered: pd.DataFrame, score_col: str, formation: dict) -> pd.DataFrame:
+    players = filtered[filtered['Position'].isin(list(formation)) & filtered[score_col].notna()]
+    return players.assign(Team=players['Team'].fillna(''), Element=players['Element'].fillna(''))
+
+
+def _top_per_position(players: pd.DataFrame, score_col: str, formation: dict) -> pd.DataFrame:
+    """Cas sans contrainte : les meilleurs joueurs de chaque poste, sélection vectorisée."""
+    scores = players[score_col].to_numpy(dtype=float)
+    positions = players['Position'].to_numpy()
+    chosen = []
+    for pos, n in formation.items():
+        idx = np.flatnonzero(positions == pos)
+        if len(idx) > n:
+            idx = idx[np.argpartition(-scores[idx], n - 1)[:n]]
+        chosen.append(idx)
+    return players.iloc[np.concatenate(chosen)]
+
+
+def _available(players: pd.DataFrame, formation: dict) -> dict:
+    """Places réellement pourvues par poste (moins de candidats que de places : poste incomplet)."""
+    counts = players['Position'].value_counts()
+    return {pos: min(n, int(counts.get(pos, 0))) for pos, n in formation.items()}
+
+
+def _prune(players: pd.DataFrame, score_col: str, formation: dict, max_per_team=None, max_per_element=None) -> pd.DataFrame:
+    """
+    Réduit le problème sans perdre l'optimum (échange : un joueur retenu hors des meilleurs gardés
+    peut toujours être remplacé par un gardé au moins aussi bon sans dépasser de plafond).
+    - Par (poste, colonnes plafonnées) : les min(places, plafonds) meilleurs ; sans plafond, par (poste, équipe, élément)
+    - Puis pour chaque plafond, par poste (et par valeur de l'autre colonne plafonnée) : places + (équipes ou
+      éléments pouvant être pleins) x ce nombre, borne indépendante du nombre d'équipes
+    """
+    caps = {col: cap for col, cap in (('Team', max_per_team), ('Element', max_per_element)) if cap}
+    total = sum(formation.values())
+
+    def per_group(frame):
+        slots = frame['Position'].map(formation).to_numpy()
+        return np.minimum(slots, min(caps.values())) if caps else slots
+
+    ranked = players.sort_values(score_col, ascending=False)
+    keys = ['Position', *caps] if caps else ['Position', 'Team', 'Element']
+    ranked = ranked[ranked.groupby(keys).cumcount().to_numpy() < per_group(ranked)]
+
+    for col, cap in caps.items():
+        # Seuls les groupes pleins d'une autre valeur de `col` bloquent un remplacement dans le même groupe
+        limit = ranked['Position'].map(formation).to_numpy() + (total - 1) // cap * per_group(ranked)
+        keys = ['Position', *(other for other in caps if other != col)]
+        ranked = ranked[ranked.groupby(keys).cumcount().to_numpy() < limit]
+    return ranked
+
+
+def _solve_milp(players: pd.DataFrame, score_col: str, formation: dict, max_per_team, max_per_element) -> pd.DataFrame:
+    n = len(players)
+    rows, lower, upper = [], [], []
+
+    def add_groups(values, lo, hi):
+        codes, uniques = pd.factorize(values)
+        for g, value in enumerate(uniques):
+            rows.append(np.flatnonzero(codes == g))
+            lower.append(lo(value))
+            upper.append(hi(value))
+
+    # `formation` donne les places pourvues sur l'effectif complet (voir _available), même après élagage
+    add_groups(players['Position'].to_numpy(), lambda pos: formation[pos], lambda pos: formation[pos])
+    if max_per_team:
+        add_groups(players['Team'].to_numpy(), lambda _: 0, lambda _: max_per_team)
+    if max_per_element:
+        add_groups(players['Element'].to_numpy(), lambda _: 0, lambda _: max_per_element)
+
+    row_idx = np.concatenate([np.full(len(r), i) for i, r in enumerate(rows)])
+    col_idx = np.concatenate(rows)
+    A = csr_matrix((np.ones(len(col_idx)), (row_idx, col_idx)), shape=(len(rows), n))
+
+    result = milp(
+        c=-players[score_col].to_numpy(dtype=float),
+        constraints=LinearConstraint(A, lower, upper),
+        integrality=np.ones(n),
+        bounds=Bounds(0, 1),
+    )
+    if result.x is None:
+        # Contraintes impossibles (ex. trop peu d'équipes) : la sélection gloutonne donnera un XI incomplet
+        return None
+    return players.iloc[np.flatnonzero(result.x > 0.5)]
+
+
+def _solve_greedy(players: pd.DataFrame, score_col: str, formation: dict, max_per_team, max_per_element) -> pd.DataFrame:
+    remaining = dict(formation)
+    per_team, per_element = {}, {}
+    chosen = []
+    ranked = players.sort_values(score_col, ascending=False)
+    for i, (pos, team, element) in enumerate(zip(ranked['Position'], ranked['Team'], ranked['Element'])):
+        if not remaining.get(pos):
+            continue
+        if max_per_team and per_team.get(team, 0) >= max_per_team:
+            continue
+        if max_per_element and per_element.get(element, 0) >= max_per_element:
+            continue
+        chosen.append(i)
+        remaining[pos] -= 1
+        per_team[team] = per_team.get(team, 0) + 1
+        per_element[element] = per_element.get(element, 0) + 1
+        if not any(remaining.values()):
+            break
+    return ranked.iloc[chosen]
+
+
+def best_lineup(filtered: pd.DataFrame, score_col: str, max_per_team: int = None, max_per_element: int = None,
+                formation: dict = FORMATION):
+    """
+    Meilleure équipe selon `score_col` en respectant les places du terrain.
+    - Sans contrainte : top-k vectorisé par poste (toujours optimal)
+    - Avec plafond par équipe ou par élément : programme linéaire en nombres entiers (scipy),
+      ou sélection gloutonne si scipy est absent
+    Renvoie (équipe triée par poste, optimal garanti).
+    """
+    players = _candidates(filtered, score_col, formation)
+    if players.empty:
+        return players, True
+
+    if not max_per_team and not max_per_element:
+        lineup, exact = _top_per_position(players, score_col, formation), True
+    else:
+        available = _available(players, formation)
+        lineup = None
+        if milp is not None:
+            pruned = _prune(players, score_col, available, max_per_team, max_per_element)
+            lineup = _solve_milp(pruned, score_col, available, max_per_team, max_per_element)
+        exact = lineup is not None
+        if lineup is None:
+            # L'élagage suppose un problème réalisable : la sélection gloutonne voit tout l'effectif
+            lineup = _solve_greedy(players, score_col, formation, max_per_team, max_per_element)
+
+    order = lineup['Position'].map(POSITION_ORDER)
+    lineup = lineup.assign(Position_Order=order).sort_values(['Position_Order', score_col], ascending=[True, False])
+    return lineup.drop(columns='Position_Order'), exact
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+
+from ie_data import STATS_COLS
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy est optionnel : recherche exhaustive uniquement
+    cKDTree = None
+
+METRICS = ['cosine', 'euclidean']
+TREE_MIN_ROWS = 50_000  # Au-delà (en nombre de candidats), un arbre KD remplace le produit matriciel complet
+BLOCK_ELEMS = 4_000_000  # Taille maximale d'un bloc de scores (requêtes x candidats) en mode exhaustif
+
+
+class SimilarityIndex:
+    """
+    Recherche des joueurs les plus proches sur les statistiques :
+    - Matrice z-scorée float32 construite une fois sur tout l'effectif
+    - k plus proches voisins par un produit matriciel + argpartition
+    - Arbre KD (scipy) quand l'ensemble des candidats est grand, si disponible
+    Les requêtes peuvent être restreintes à un sous-ensemble (effectif filtré).
+    """
+
+    def __init__(self, df: pd.DataFrame, cols=STATS_COLS, tree_min_rows: int = TREE_MIN_ROWS):
+        values = df[cols].to_numpy(dtype=np.float32)
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0)
+        std[std == 0] = 1
+        matrix = (values - mean) / std
+        matrix[np.isnan(matrix)] = 0  # Statistique manquante = valeur moyenne
+
+        self.cols = list(cols)
+        self.labels = df.index
+        self.names = df['Name'].to_numpy()
+        self.matrix = matrix
+        self.sq_norms = np.einsum('ij,ij->i', matrix, matrix)
+        norms = np.sqrt(self.sq_norms)
+        norms[norms == 0] = 1
+        self.unit = matrix / norms[:, None]
+        self.tree_min_rows = tree_min_rows
+        self._trees = {}
+
+    def _use_tree(self, n_candidates: int) -> bool:
+        # Sur un petit ensemble filtré, l'arbre global devrait parcourir beaucoup de voisins exclus
+        return cKDTree is not None and n_candidates >= self.tree_min_rows
+
+    def positions(self, labels) -> np.ndarray:
+        """Positions dans la matrice des lignes d'index `labels` (ex. filtered.index)."""
+        return self.labels.get_indexer(labels)
+
+    def _space(self, metric: str) -> np.ndarray:
+        # Sur des vecteurs unitaires, la distance euclidienne classe comme le cosinus
+        return self.unit if metric == 'cosine' else self.matrix
+
+    def _scores(self, queries: np.ndarray, candidates: np.ndarray, metric: str) -> np.ndarray:
+        """Scores (plus grand = plus proche) entre des positions de requête et de candidats."""
+        space = self._space(metric)
+        dots = space[queries] @ space[candidates].T
+        if metric == 'cosine':
+            return dots
+        # ||a - b||² = ||a||² + ||b||² - 2 a·b, renvoyé en négatif pour garder "plus grand = plus proche"
+        sq = self.sq_norms[queries][:, None] + self.sq_norms[candidates][None, :] - 2 * dots
+        return -np.sqrt(np.maximum(sq, 0))
+
+    def _top_k(self, scores: np.ndarray, k: int):
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return np.empty((scores.shape[0], 0), dtype=np.int64), np.empty((scores.shape[0], 0), dtype=scores.dtype)
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+        return np.take_along_axis(part, order, axis=1), np.take_along_axis(part_scores, order, axis=1)
+
+    @staticmethod
+    def _tree_scores(dist: np.ndarray, metric: str) -> np.ndarray:
+        return 1 - dist ** 2 / 2 if metric == 'cosine' else -dist
+
+    def _tree_query(self, query: int, k: int, metric: str, allowed):
+        space = self._space(metric)
+        if metric not in self._trees:
+            self._trees[metric] = cKDTree(space)
+        tree = self._trees[metric]
+        # On élargit la recherche jusqu'à obtenir k voisins autorisés par le filtre
+        n_query = k + 1
+        while True:
+            n_query = min(n_query, len(space))
+            dist, idx = tree.query(space[query], k=n_query)
+            dist, idx = np.atleast_1d(dist), np.atleast_1d(idx)
+            keep = (idx != query) & (allowed[idx] if allowed is not None else True)
+            if keep.sum() >= k or n_query == len(space):
+                idx, dist = idx[keep][:k], dist[keep][:k]
+                return idx, self._tree_scores(dist, metric)
+            n_query *= 4
+
+    def query(self, query: int, k: int = 10, metric: str = 'cosine', candidates: np.ndarray = None):
+        """
+        Les k joueurs les plus proches de la position `query` parmi `candidates` (positions),
+        ou parmi tout l'effectif. Renvoie (positions, scores) triés du plus proche au plus lointain.
+        """
+        if self._use_tree(len(self.matrix) if candidates is None else len(candidates)):
+            allowed = None
+            if candidates is not None:
+                allowed = np.zeros(len(self.matrix), dtype=bool)
+                allowed[candidates] = True
+            return self._tree_query(query, k, metric, allowed)
+
+        if candidates is None:
+            candidates = np.arange(len(self.matrix))
+        candidates = candidates[candidates != query]
+        idx, scores = self._top_k(self._scores(np.array([query]), candidates, metric), k)
+        return candidates[idx[0]], scores[0]
+
+    def all_pairs(self, k: int = 10, metric: str = 'cosine', candidates: np.ndarray = None,
+                  block_elems: int = BLOCK_ELEMS):
+        """
+        k plus proches voisins de chaque candidat : arbre KD construit sur les candidats pour un grand ensemble,
+        sinon produit matriciel par blocs d'au plus `block_elems` scores.
+        """
+        if candidates is None:
+            candidates = np.arange(len(self.matrix))
+        k = max(min(k, len(candidates) - 1), 0)
+        if k == 0:
+            return np.empty((len(candidates), 0), dtype=np.int64), np.empty((len(candidates), 0), dtype=np.float32)
+        if self._use_tree(len(candidates)):
+            return self._tree_all_pairs(k, metric, candidates)
+
+        all_idx = np.empty((len(candidates), k), dtype=np.int64)
+        all_scores = np.empty((len(candidates), k), dtype=np.float32)
+        batch_size = max(1, block_elems // len(candidates))
+        for start in range(0, len(candidates), batch_size):
+            queries = candidates[start:start + batch_size]
+            scores = self._scores(queries, candidates, metric)
+            # Un joueur n'est pas son propre voisin
+            scores[np.arange(len(queries)), np.arange(start, start + len(queries))] = -np.inf
+            idx, top = self._top_k(scores, k)
+            all_idx[start:start + len(queries)] = candidates[idx]
+            all_scores[start:start + len(queries)] = top
+        return all_idx, all_scores
+
+    def _tree_all_pairs(self, k: int, metric: str, candidates: np.ndarray):
+        points = self._space(metric)[candidates]
+        dist, idx = cKDTree(points).query(points, k=k + 1)
+        # Le joueur lui-même est retiré ; s'il n'apparaît pas (doublons exacts), on retire le plus lointain
+        own = idx == np.arange(len(candidates))[:, None]
+        own[~own.any(axis=1), -1] = True
+        keep = ~own
+        idx = idx[keep].reshape(len(candidates), k)
+        dist = dist[keep].reshape(len(candidates), k)
+        return candidates[idx], self._tree_scores(dist, metric).astype(np.float32)
+
+    def similar_players(self, name: str, k: int = 10, metric: str = 'cosine', within: pd.DataFrame = None) -> pd.DataFrame:
+        """Tableau des k joueurs les plus proches de `name` (dans `within` si fourni)."""
+        candidates = self.positions(within.index) if within is not None else None
+        matches = np.flatnonzero(self.names == name)
+        if candidates is not None and np.isin(matches, candidates).any():
+            matches = matches[np.isin(matches, candidates)]
+        query = int(matches[0])
+        idx, scores = self.query(query, k, metric, candidates)
+        return pd.DataFrame({'Name': self.names[idx], 'Score': scores}, index=self.labels[idx])
+
+    def similarity_table(self, k: int = 10, metric: str = 'cosine', within: pd.DataFrame = None) -> pd.DataFrame:
+        """Table d'export : pour chaque joueur, ses k voisins avec rang et score."""
+        candidates = self.positions(within.index) if within is not None else np.arange(len(self.matrix))
+        idx, scores = self.all_pairs(k, metric, candidates)
+        n, k = idx.shape
+        return pd.DataFrame({
+            'Name': np.repeat(self.names[candidates], k),
+            'Rang': np.tile(np.arange(1, k + 1), n),
+            'Similaire': self.names[idx.ravel()],
+            'Score': scores.ravel(),
+        })
@@ -0,0 +1,96 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from ie_service import QueryEngine, make_server
+
+ROSTER = """Name,Team,Position,Element,FP,TP,Kick,Body,Control,Guard,Speed,Stamina,Guts,1st Move,2nd Move,3rd Move,4th Move
+Mark Evans,Raimon,GK,Earth,191,184,72,72,70,77,68,69,79,God Hand,Grenade Shot,Majin The Hand,Triple Defence
+Axel Blaze,Raimon,FW,Fire,180,190,80,60,70,50,70,60,75,Fire Tornado,Heat Tackle,Quick Draw,Flame Dance
+Joe Nalist,Royal,GK,Wood,170,150,60,70,60,75,60,65,70,Power Shield,Killer Slide,Quick Draw,Heat Tackle
+Joe Nalist,Zeus,MF,Wind,160,170,65,62,68,55,72,60,66,Quick Draw,Killer Slide,Heat Tackle,God Hand
+"""
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ie") / "roster.csv"
+    path.write_text(ROSTER, encoding="utf-8")
+    return QueryEngine(str(path))
+
+
+@pytest.fixture(scope="module")
+def server(engine):
+    server = make_server(engine, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(url: str, body: bytes):
+    request = urllib.request.Request(url, data=body, method="POST")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_equivalent_queries_share_a_cache_key(engine):
+    a = engine.normalize({'op': 'top_players', 'filters': {'Team': ['Royal', 'Raimon', 'Raimon']}})
+    b = engine.normalize({'filters': {'Team': ['Raimon', 'Royal']}, 'n': '5', 'crit': 'Moyenne'})
+    assert a == b
+    # Un filtre absent vaut toutes les valeurs
+    assert engine.normalize({'op': 'count'}) == engine.normalize({'op': 'count', 'filters': {'Team': ['Raimon', 'Royal', 'Zeus']}})
+
+
+@pytest.mark.parametrize("query", [
+    [],
+    {'op': 'inconnue'},
+    {'filters': {'Team': 'Raimon'}},
+    {'filters': ['Team']},
+    {'filters': {'Inconnu': []}},
+    {'crit': 'Inconnu'},
+    {'op': 'top_teams', 'n': -2},
+    {'op': 'top_players', 'n': 0},
+    {'op': 'team_profile', 'team': ['Raimon']},
+])
+def test_invalid_queries_are_rejected(engine, query):
+    with pytest.raises(ValueError):
+        engine.normalize(query)
+
+
+def test_batch_reports_errors_per_item(engine):
+    results = engine.batch([{'op': 'count'}, 1, {'op': 'count', 'filters': {'Team': ['Raimon']}}, {'n': -1}])
+    assert results[0] == {'result': {'count': 4}}
+    assert 'error' in results[1]
+    assert results[2] == {'result': {'count': 2}}
+    assert 'error' in results[3]
+
+
+def test_http_query_and_batch(server):
+    assert post(server + "/query", b'{"op": "count"}') == (200, {'result': {'count': 4}})
+    status, payload = post(server + "/batch", b'{"queries": [{"op": "count"}, 1]}')
+    assert status == 200
+    assert payload['results'][0] == {'result': {'count': 4}}
+    assert 'error' in payload['results'][1]
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/query", b"[]"),
+    ("/query", b"{not json"),
+    ("/query", b'{"filters": {"Team": "Raimon"}}'),
+    ("/query", b'{"op": "top_teams", "n": -2}'),
+    ("/batch", b"[1]"),
+    ("/batch", b'{"queries": 1}'),
+])
+def test_http_bad_requests_return_400(server, path, body):
+    status, payload = post(server + path, body)
+    assert status == 400
+    assert 'error' in payload
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+import lineup
+from lineup import FORMATION, best_lineup, _available, _candidates, _prune, _solve_greedy, _solve_milp
+
+
+def roster(rows):
+    return pd.DataFrame(rows, columns=['Name', 'Team', 'Position', 'Element', 'Score'])
+
+
+def random_roster(n, teams, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Name': [f"Joueur {i}" for i in range(n)],
+        'Team': rng.integers(0, teams, n).astype(str),
+        'Position': rng.choice(list(FORMATION), n),
+        'Element': rng.choice(['Feu', 'Air', 'Bois', 'Terre'], n),
+        'Score': rng.normal(50, 10, n).round(1),
+    })
+
+
+def require_milp():
+    pytest.importorskip("scipy")
+    if lineup.milp is None:
+        pytest.skip("scipy.optimize.milp indisponible")
+
+
+@pytest.fixture
+def players():
+    # Raimon domine chaque poste ; les autres équipes complètent à score plus faible
+    rows = []
+    for team, base in [('Raimon', 90), ('Royal', 70), ('Zeus', 50)]:
+        for pos, n in FORMATION.items():
+            for i in range(n):
+                rows.append((f"{team} {pos}{i}", team, pos, 'Feu' if i % 2 else 'Air', base - i))
+    return roster(rows)
+
+
+def test_unconstrained_takes_best_per_position(players):
+    team, exact = best_lineup(players, 'Score')
+    assert exact
+    assert len(team) == sum(FORMATION.values())
+    assert set(team['Team']) == {'Raimon'}
+
+
+def test_prune_keeps_n_best_per_group(players):
+    pruned = _prune(players, 'Score', {'GK': 1, 'DF': 1, 'MF': 1, 'FW': 1})
+    assert pruned.groupby(['Position', 'Team', 'Element']).size().max() == 1
+    # Le meilleur de chaque groupe est conservé
+    best = players.sort_values('Score', ascending=False).drop_duplicates(['Position', 'Team', 'Element'])
+    assert set(pruned.index) == set(best.index)
+
+
+def test_greedy_respects_team_cap(players):
+    team = _solve_greedy(players, 'Score', FORMATION, max_per_team=4, max_per_element=None)
+    assert len(team) == sum(FORMATION.values())
+    assert team['Team'].value_counts().max() <= 4
+
+
+def test_milp_respects_caps_and_beats_greedy(players):
+    pytest.importorskip("scipy")
+    if lineup.milp is None:
+        pytest.skip("scipy.optimize.milp indisponible")
+    team, exact = best_lineup(players, 'Score', max_per_team=4, max_per_element=6)
+    assert exact
+    assert len(team) == sum(FORMATION.values())
+    assert team['Team'].value_counts().max() <= 4
+    assert team['Element'].value_counts().max() <= 6
+    greedy = _solve_greedy(_prune(players, 'Score', FORMATION), 'Score', FORMATION, 4, 6)
+    assert team['Score'].sum() >= greedy['Score'].sum()
+
+
+def test_infeasible_caps_fall_back_to_greedy(players):
+    # Une seule équipe autorisée à 1 joueur : impossible de remplir les 12 places
+    solo = players[players['Team'] == 'Raimon']
+    team, exact = best_lineup(solo, 'Score', max_per_team=1)
+    assert not exact
+    assert len(team) == 1
+
+
+def test_homonyms_are_distinct_rows():
+    players = roster([
+        ('Joe Nalist', 'Raimon', 'GK', 'Feu', 80),
+        ('Joe Nalist', 'Royal', 'GK', 'Bois', 70),
+        ('Mark', 'Raimon', 'DF', 'Air', 60),
+    ])
+    # La composition renvoie des lignes : seul le gardien retenu est placé, pas son homonyme
+    team, _ = best_lineup(players, 'Score')
+    assert list(team.index) == [0, 2]
+
+
+def test_empty_roster_with_caps():
+    team, exact = best_lineup(random_roster(10, 3).iloc[:0], 'Score', max_per_team=2)
+    assert team.empty and exact
+
+
+@pytest.mark.parametrize("caps", [(1, None), (2, None), (None, 3), (1, 3), (2, 4)])
+def test_cap_aware_prune_keeps_the_optimum(caps):
+    require_milp()
+    for seed in range(5):
+        players = _candidates(random_roster(400, 15, seed), 'Score', FORMATION)
+        available = _available(players, FORMATION)
+        full = _solve_milp(players, 'Score', available, *caps)
+        pruned = _solve_milp(_prune(players, 'Score', available, *caps), 'Score', available, *caps)
+        assert full['Score'].sum() == pytest.approx(pruned['Score'].sum())
+
+
+def test_prune_size_does_not_grow_with_team_count():
+    players = _candidates(random_roster(100_000, 2_000), 'Score', FORMATION)
+    available = _available(players, FORMATION)
+    # Bornes : quelques dizaines de joueurs par poste et par élément, quel que soit le nombre d'équipes
+    assert len(_prune(players, 'Score', available, 2, None)) <= 100
+    assert len(_prune(players, 'Score', available, 1, 3)) <= 300
+
+
+def test_caps_on_large_roster_are_interactive():
+    require_milp()
+    roster = random_roster(100_000, 2_000)
+    start = time.perf_counter()
+    team, exact = best_lineup(roster, 'Score', max_per_team=1, max_per_element=3)
+    assert time.perf_counter() - start < 5
+    assert exact and len(team) == sum(FORMATION.values())
+    assert team['Team'].value_counts().max() == 1
+    assert team['Element'].value_counts().max() <= 3
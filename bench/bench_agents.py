@@ -0,0 +1,95 @@
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+
+from common import ROOT, add_project_path, measure, report, report_error
+from mistral_stub import MistralStub
+
+# Mêmes prompts que les points d'entrée des agents : les fixtures restent valides
+SCRIPT_PROMPT = """
+Tu dois créer un fichier Python nommé hello.py qui contient le code :
+print("hello world")
+
+Puis exécuter ce fichier. Quand tu as terminé, appelle stop().
+"""
+TEST_PROMPT = """
+Crée une fonction Python nommée `add(a, b)` qui retourne leur somme.
+Écris un test unitaire associé, exécute-le, puis arrête-toi quand c'est bon.
+"""
+
+
+def load_module(name: str, *parts):
+    """Charge un module du projet par chemin (script/test.py masquerait le paquet `test` sinon)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, *parts))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def isolated_cwd():
+    previous = os.getcwd()
+    path = tempfile.mkdtemp(prefix="bench_agent_")
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _run_quiet(func):
+    with isolated_cwd(), contextlib.redirect_stdout(io.StringIO()):
+        return func()
+
+
+def _bench(results: dict, name: str, func, runs: int):
+    try:
+        report(results, name, measure(func, repeat=runs, warmup=0))
+    except Exception as e:
+        report_error(results, name, e)
+
+
+def run(results: dict, repeat: int = 3, record: bool = False):
+    print("\n[BENCH] Agents (réponses Mistral rejouées)")
+    add_project_path("script")
+    add_project_path("blender")
+
+    with MistralStub(mode="record" if record else "replay") as stub:
+        os.environ["MISTRAL_API_URL"] = stub.url
+        # En enregistrement, une seule exécution suffit à créer les fixtures
+        runs = 1 if record else repeat
+
+        ia = load_module("bench_ia_agent", "script", "IA.py")
+        ia.API_URL = stub.url
+        ia_history = list(ia.history)
+
+        def script_agent():
+            ia.history[:] = ia_history
+            _run_quiet(lambda: ia.run_agent(SCRIPT_PROMPT, max_step=3))
+
+        _bench(results, "agents.script_ia.run_agent", script_agent, runs)
+
+        test_agent = load_module("bench_test_agent", "script", "test.py")
+        test_agent.API_URL = stub.url
+        test_history = list(test_agent.history)
+
+        def pytest_agent():
+            test_agent.history[:] = test_history
+            _run_quiet(lambda: test_agent.run_agent(TEST_PROMPT, max_step=5).close())
+
+        _bench(results, "agents.script_test.run_agent", pytest_agent, runs)
+
+        if shutil.which(os.getenv("BLENDER_EXEC", "blender")) is None:
+            print("  [SKIP] Blender introuvable : boucle agent Blender ignorée (voir BLENDER_EXEC).")
+        else:
+            blender_agent = load_module("bench_blender_agent", "blender", "agent.py")
+            blender_agent.MISTRAL_API_URL = stub.url
+            _bench(results, "agents.blender.run_agent",
+                   lambda: _run_quiet(lambda: blender_agent.run_agent(max_attempts=1)), runs)
+
+        if stub.misses:
+            print(f"  [WARN] {stub.misses} requête(s) sans fixture : relancer avec --record.")
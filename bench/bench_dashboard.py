@@ -0,0 +1,70 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from common import add_project_path, measure, report
+
+SIZES = [500, 10_000, 100_000, 1_000_000]
+POSITIONS = ['GK', 'DF', 'MF', 'FW']
+ELEMENTS = ['Earth', 'Fire', 'Wind', 'Wood']
+
+
+def synthetic_roster(n: int, n_teams: int = 60, n_moves: int = 300, seed: int = 0) -> pd.DataFrame:
+    """Effectif aléatoire au format de IE1.csv."""
+    from ie_data import STATS_COLS, MOVES_COLS
+
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i}" for i in range(n_teams)])
+    moves = np.array([f"Move {i}" for i in range(n_moves)], dtype=object)
+    data = {
+        'Name': [f"Player {i}" for i in range(n)],
+        'Team': teams[rng.integers(0, n_teams, n)],
+        'Position': np.array(POSITIONS)[rng.choice(4, n, p=[0.1, 0.35, 0.35, 0.2])],
+        'Element': np.array(ELEMENTS)[rng.integers(0, 4, n)],
+    }
+    for col in STATS_COLS:
+        data[col] = rng.integers(40, 200 if col in ('FP', 'TP') else 100, n)
+    for col in MOVES_COLS:
+        values = moves[rng.integers(0, n_moves, n)]
+        values[rng.random(n) < 0.05] = np.nan
+        data[col] = values
+    return pd.DataFrame(data)
+
+
+def run(results: dict, repeat: int = 5, sizes=SIZES):
+    print("\n[BENCH] Dashboard : filtres, classements et graphiques")
+    add_project_path("Dashboard_ie")
+    from ie_data import (STATS_COLS, MOVES_COLS, filter_players, add_score, top_players, top_teams,
+                         move_counts)
+    from charts import count_plot, radar_chart
+
+    for n in sizes:
+        df = synthetic_roster(n)
+        teams = sorted(df['Team'].unique())
+        positions = sorted(df['Position'].unique())
+        elements = sorted(df['Element'].unique())
+        all_moves = {col: sorted(df[col].dropna().unique()) for col in MOVES_COLS}
+        # Cas par défaut du dashboard (tout sélectionné) et cas restreint
+        narrow = (teams[: len(teams) // 4], ['DF', 'MF'], elements[:2])
+
+        report(results, f"dashboard.filter.all.{n}",
+               measure(lambda: filter_players(df, teams, positions, elements, all_moves), repeat=repeat))
+        report(results, f"dashboard.filter.narrow.{n}",
+               measure(lambda: filter_players(df, *narrow, all_moves), repeat=repeat))
+
+        filtered = filter_players(df, teams, positions, elements, all_moves)
+        report(results, f"dashboard.score.moyenne.{n}", measure(lambda: add_score(filtered, 'Moyenne'), repeat=repeat))
+        report(results, f"dashboard.rank.players.{n}", measure(lambda: top_players(filtered, 'Moyenne'), repeat=repeat))
+        report(results, f"dashboard.rank.teams.{n}", measure(lambda: top_teams(filtered, 'Moyenne'), repeat=repeat))
+        report(results, f"dashboard.move_counts.{n}", measure(lambda: move_counts(filtered), repeat=repeat))
+
+        def charts():
+            plt.close(count_plot(filtered, 'Position', 'viridis'))
+            stats = filtered[STATS_COLS].mean()
+            plt.close(radar_chart(STATS_COLS, [
+                {"values": (stats / stats.max() * 100).tolist(), "annotations": stats.tolist(), "color": "blue"},
+            ], "Profil moyen"))
+
+        report(results, f"dashboard.charts.{n}", measure(charts, repeat=repeat))
@@ -0,0 +1,44 @@
+import contextlib
+import io
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from common import add_project_path, measure, report
+
+SIZES = [(256, 256), (512, 512), (1024, 1024), (2048, 2048), (3840, 2160)]
+
+
+def synthetic_render(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """Image proche d'un rendu valide : sol vert, rivière bleue, troncs sombres, bruit."""
+    rng = np.random.default_rng(seed)
+    img = np.empty((height, width, 3), dtype=np.uint8)
+    img[:] = (60, 150, 60)
+    img[:, width * 2 // 5: width * 3 // 5] = (40, 80, 200)
+    for x in rng.integers(0, width - width // 40, size=3):
+        img[height // 4: height // 2, x: x + width // 40] = (20, 15, 10)
+    noise = rng.integers(-20, 21, size=img.shape, dtype=np.int16)
+    return np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def run(results: dict, repeat: int = 5, sizes=SIZES):
+    print("\n[BENCH] Validateur de rendu")
+    add_project_path("blender")
+    from validator import validate_scene, count_color_range
+
+    with tempfile.TemporaryDirectory(prefix="bench_validator_") as tmp:
+        for width, height in sizes:
+            img = synthetic_render(width, height)
+            path = os.path.join(tmp, f"render_{width}x{height}.png")
+            Image.fromarray(img).save(path)
+            pixels = img.reshape((-1, 3))
+
+            def validate():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    validate_scene(path)
+
+            report(results, f"validator.validate_scene.{width}x{height}", measure(validate, repeat=repeat))
+            report(results, f"validator.count_color_range.{width}x{height}",
+                   measure(lambda: count_color_range(pixels, (25, 80, 25), (110, 210, 110)), repeat=repeat))
@@ -0,0 +1,93 @@
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "bench", "fixtures")
+RESULTS_DIR = os.path.join(ROOT, "bench", "results")
+
+
+def add_project_path(*parts):
+    """Rend importables les modules d'un sous-dossier du projet (blender, script, Dashboard_ie)."""
+    path = os.path.join(ROOT, *parts)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def measure(func, repeat: int = 5, warmup: int = 1) -> dict:
+    """Exécute `func` plusieurs fois et renvoie les statistiques de temps (ms)."""
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": min(times),
+        "median_ms": statistics.median(times),
+        "max_ms": max(times),
+        "repeat": repeat,
+    }
+
+
+def report(results: dict, name: str, stats: dict):
+    results[name] = stats
+    print(f"  {name:<50} médiane {stats['median_ms']:>10.2f} ms   min {stats['min_ms']:>10.2f} ms")
+
+
+def report_error(results: dict, name: str, error: Exception):
+    """Enregistre l'échec d'un benchmark : il apparaît dans les résultats et fait échouer la suite."""
+    results[name] = {"error": f"{type(error).__name__}: {error}"}
+    print(f"  [ERREUR] {name} : {error}")
+
+
+def failed_benchmarks(results: dict) -> list:
+    return sorted(name for name, stats in results.items() if "error" in stats)
+
+
+# === Résultats et comparaison avec une référence ===
+def save_results(results: dict, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created": time.time(), "results": results}, f, indent=2, sort_keys=True)
+    print(f"[BENCH] Résultats écrits dans {path}")
+
+
+def compare_results(results: dict, baseline_path: str, tolerance: float = 0.15, prefixes: tuple = ("",)) -> list:
+    """
+    Renvoie la liste des benchmarks en échec par rapport à la référence :
+    médiane au-delà de `tolerance`, erreur, ou benchmark de la référence absent des résultats.
+    Seuls les benchmarks de la référence dont le nom commence par l'un des `prefixes` (suites lancées) sont attendus.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    failures = []
+    print(f"\n[BENCH] Comparaison avec {baseline_path} (tolérance {tolerance:.0%})")
+    expected = {name for name in baseline if name.startswith(tuple(prefixes))}
+    for name in sorted(expected | set(results)):
+        stats = results.get(name)
+        if stats is None:
+            print(f"  {name:<50} MANQUANT")
+            failures.append(name)
+            continue
+        if "error" in stats:
+            print(f"  {name:<50} ERREUR")
+            failures.append(name)
+            continue
+        if "median_ms" not in baseline.get(name, {}):
+            print(f"  {name:<50} nouveau")
+            continue
+        ref = baseline[name]["median_ms"]
+        ratio = stats["median_ms"] / ref if ref else float("inf")
+        status = "OK"
+        if ratio > 1 + tolerance:
+            status = "RÉGRESSION"
+            failures.append(name)
+        elif ratio < 1 - tolerance:
+            status = "amélioration"
+        print(f"  {name:<50} {ratio:>6.2f}x  {status}")
+    return failures
@@ -0,0 +1,121 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from common import FIXTURES_DIR
+
+UPSTREAM_URL = "https://api.mistral.ai/v1/chat/completions"
+
+
+def request_key(body: dict) -> str:
+    """Clé de fixture : hash des champs qui déterminent la réponse du modèle."""
+    relevant = {k: body.get(k) for k in ("model", "messages", "temperature", "stream")}
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class MistralStub:
+    """
+    Serveur local compatible /v1/chat/completions :
+    - mode "record" : relaie vers l'API Mistral et enregistre chaque réponse en fixture
+    - mode "replay" : rejoue les fixtures sans réseau (404 si la requête est inconnue)
+    """
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, mode: str = "replay", port: int = 0,
+                 upstream: str = UPSTREAM_URL):
+        self.fixtures_dir = fixtures_dir
+        self.mode = mode
+        self.upstream = upstream
+        self.misses = 0
+        os.makedirs(fixtures_dir, exist_ok=True)
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}/v1/chat/completions"
+
+    def _fixture_path(self, key: str) -> str:
+        return os.path.join(self.fixtures_dir, f"{key}.json")
+
+    def _record(self, raw_body: bytes, key: str) -> dict:
+        headers = {
+            "Authorization": f"Bearer {os.getenv('MISTRAL_API_KEY')}",
+            "Content-Type": "application/json",
+        }
+        response = requests.post(self.upstream, headers=headers, data=raw_body)
+        fixture = {
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "application/json"),
+            "body": response.text,
+        }
+        if response.status_code == 200:
+            with open(self._fixture_path(key), "w", encoding="utf-8") as f:
+                json.dump(fixture, f, ensure_ascii=False)
+            print(f"[STUB] Fixture enregistrée : {key}")
+        return fixture
+
+    def _replay(self, key: str) -> dict:
+        path = self._fixture_path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            print(f"[STUB] Fixture absente : {key}")
+            return {"status": 404, "content_type": "application/json",
+                    "body": json.dumps({"error": f"fixture {key} absente"})}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                raw_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                key = request_key(json.loads(raw_body))
+                fixture = stub._record(raw_body, key) if stub.mode == "record" else stub._replay(key)
+
+                payload = fixture["body"].encode("utf-8")
+                self.send_response(fixture["status"])
+                self.send_header("Content-Type", fixture["content_type"])
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur Mistral local (enregistrement / rejeu).")
+    parser.add_argument("--record", action="store_true", help="relaie vers l'API et enregistre les réponses")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    stub = MistralStub(args.fixtures, "record" if args.record else "replay", args.port)
+    print(f"[STUB] {stub.mode} sur {stub.url} — exporter MISTRAL_API_URL={stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.server.server_close()
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+
+from common import RESULTS_DIR, add_project_path, save_results, compare_results, failed_benchmarks
+
+# Module tracing (racine du dépôt) pour les modules mesurés
+add_project_path()
+
+SUITES = ["agents", "validator", "dashboard"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks hors ligne du projet.")
+    parser.add_argument("--suite", choices=SUITES + ["all"], default="all")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="tailles réduites (images ≤ 1024², effectifs ≤ 100k)")
+    parser.add_argument("--record", action="store_true", help="enregistre les fixtures Mistral (réseau requis)")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "latest.json"))
+    parser.add_argument("--baseline", help="fichier de résultats de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    suites = SUITES if args.suite == "all" else [args.suite]
+    results = {}
+
+    if "agents" in suites:
+        import bench_agents
+        bench_agents.run(results, repeat=args.repeat, record=args.record)
+    if "validator" in suites:
+        import bench_validator
+        sizes = bench_validator.SIZES[:3] if args.quick else bench_validator.SIZES
+        bench_validator.run(results, repeat=args.repeat, sizes=sizes)
+    if "dashboard" in suites:
+        import bench_dashboard
+        sizes = bench_dashboard.SIZES[:3] if args.quick else bench_dashboard.SIZES
+        bench_dashboard.run(results, repeat=args.repeat, sizes=sizes)
+
+    save_results(results, args.output)
+
+    failures = failed_benchmarks(results)
+    if args.baseline:
+        failures = compare_results(results, args.baseline, args.tolerance, prefixes=tuple(f"{s}." for s in suites))
+    if failures:
+        print(f"\n[BENCH] {len(failures)} benchmark(s) en échec : {', '.join(failures)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,27 @@
 import os
+import sys
 import subprocess
 import requests
 import time
 from dotenv import load_dotenv
-from validator import validate_scene
+
+if __name__ == "__main__":
+    # Lancé directement : le module tracing est à la racine du dépôt
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from render_index import RenderIndex
+from tracing import traced, span, current_span
 
 load_dotenv()
 
 MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
+MISTRAL_API_URL = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")
 SCRIPT_FILENAME = "generated_scene.py"
 RENDER_FILENAME = "render.png"
 MAX_ATTEMPTS = 6
+TEMPERATURE = 0.3
+MAX_TEMPERATURE = 1.0
+STUCK_AFTER = 2  # Échecs identiques consécutifs avant de changer de stratégie
 
 # Prompt simplifié et sans options qui n'existent pas
 PROMPT = (
@@ -24,9 +35,17 @@ PROMPT = (
     "Ne génère que du code Python sans commentaires ni balises Markdown."
 )
 
+# Ajouté au prompt quand la boucle reproduit la même scène invalide
+RETRY_HINT = (
+    "\nLes tentatives précédentes ont produit plusieurs fois la même scène refusée. "
+    "Change nettement la composition : taille et position du sol, de la rivière et des arbres, "
+    "éclairage et placement de la caméra, pour que le vert, le bleu et les ombres soient bien visibles."
+)
 
-def prompt_to_blender_code(prompt: str) -> str:
-    url = "https://api.mistral.ai/v1/chat/completions"
+
+@traced("mistral.blender_code")
+def prompt_to_blender_code(prompt: str, temperature: float = TEMPERATURE) -> str:
+    url = MISTRAL_API_URL
     headers = {
         "Authorization": f"Bearer {MISTRAL_API_KEY}",
         "Content-Type": "application/json"
@@ -41,7 +60,7 @@ def prompt_to_blender_code(prompt: str) -> str:
             )},
             {"role": "user", "content": prompt}
         ],
-        "temperature": 0.3,
+        "temperature": temperature,
     }
 
     while True:
@@ -54,7 +73,12 @@ def prompt_to_blender_code(prompt: str) -> str:
             raise RuntimeError(f"Erreur API : {response.status_code} - {response.text}")
         break
 
-    return clean_code(response.json()["choices"][0]["message"]["content"])
+    payload = response.json()
+    usage = payload.get("usage", {})
+    current_span().set("prompt_tokens", usage.get("prompt_tokens"))
+    current_span().set("completion_tokens", usage.get("completion_tokens"))
+    current_span().set("bytes", len(response.content))
+    return clean_code(payload["choices"][0]["message"]["content"])
 
 
 def clean_code(code: str) -> str:
@@ -65,9 +89,12 @@ def clean_code(code: str) -> str:
     return "\n".join(lines)
 
 
+@traced("blender.patch_script")
 def patch_script(script: str) -> str:
     import re
 
+    current_span().set("bytes", len(script))
+
     # Supprimer lignes dangereuses comme 'inputs["Specular"]' ou 'inputs["Roughness"]'
     script = re.sub(r".*inputs\[['\"](Specular|Roughness)['\"]\].*?\n", "", script)
 
@@ -105,25 +132,44 @@ def save_script(script: str, filename: str):
         f.write(script)
 
 
-def run_blender_script(script_path: str):
-    blender_exec = "blender"  # ou chemin complet si besoin
-    subprocess.run([blender_exec, "--background", "--python", script_path], check=True)
+@traced("blender.render")
+def run_blender_script(script_path: str, log_file=None):
+    blender_exec = os.getenv("BLENDER_EXEC", "blender")  # ou chemin complet si besoin
+    subprocess.run([blender_exec, "--background", "--python", script_path], check=True,
+                   stdout=log_file, stderr=subprocess.STDOUT if log_file else None)
 
 
-if __name__ == "__main__":
-    for attempt in range(1, MAX_ATTEMPTS + 1):
+def run_agent(prompt: str = PROMPT, max_attempts: int = MAX_ATTEMPTS) -> bool:
+    index = RenderIndex()
+    temperature = TEMPERATURE
+    current_prompt = prompt
+
+    for attempt in range(1, max_attempts + 1):
         print(f"\n🎯 Tentative {attempt}...")
         try:
-            code = prompt_to_blender_code(PROMPT)
-            code = patch_script(code)
-            save_script(code, SCRIPT_FILENAME)
-            run_blender_script(SCRIPT_FILENAME)
-
-            if validate_scene(RENDER_FILENAME):
+            with span("blender.attempt", attempt=attempt, temperature=temperature) as attempt_span:
+                code = prompt_to_blender_code(current_prompt, temperature)
+                code = patch_script(code)
+                save_script(code, SCRIPT_FILENAME)
+                run_blender_script(SCRIPT_FILENAME)
+                valid = index.validate(RENDER_FILENAME)
+                attempt_span.set("valid", valid)
+
+            if valid:
                 print("✅ Scène validée !")
-                break
+                return True
+            elif index.is_stuck(STUCK_AFTER):
+                # Même échec plusieurs fois : on change de stratégie plutôt que de refaire la même scène
+                temperature = min(temperature + 0.3, MAX_TEMPERATURE)
+                current_prompt = prompt + RETRY_HINT
+                print(f"🔀 Scène identique refusée {index.failure_streak} fois : température {temperature:.1f}, prompt modifié.")
             else:
                 print("🔁 Nouvelle tentative...")
         except Exception as e:
             print(f"❌ Erreur : {e}")
             time.sleep(5)
+    return False
+
+
+if __name__ == "__main__":
+    run_agent()
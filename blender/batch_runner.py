@@ -0,0 +1,237 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+if __name__ == "__main__":
+    # Lancé directement : le module tracing est à la racine du dépôt
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import prompt_to_blender_code, patch_script, save_script, run_blender_script, SCRIPT_FILENAME, RENDER_FILENAME
+from validator import validate_scene
+from tracing import span
+
+DB_PATH = "jobs.sqlite"
+OUTPUT_DIR = "batch_output"
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 30  # Secondes ; doublé à chaque échec
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT UNIQUE NOT NULL,
+    prompt TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_run REAL NOT NULL DEFAULT 0,
+    out_dir TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, next_run);
+"""
+
+# Cycle de vie : pending -> generating -> generated -> rendering -> done
+#                (échec : nouvel essai avec délai, puis failed après MAX_ATTEMPTS ;
+#                 une erreur de rendu repart de generated, seule une scène invalide repart de pending)
+
+
+class JobQueue:
+    """File de travaux persistante (SQLite). Seul le thread principal y accède."""
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def enqueue_file(self, path: str) -> int:
+        """Ajoute les prompts d'un fichier (texte : un prompt par ligne, ou JSONL avec une clé 'prompt')."""
+        added = 0
+        occurrences = {}
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                prompt = line
+                if line.startswith("{"):
+                    try:
+                        prompt = json.loads(line).get("prompt")
+                    except ValueError:
+                        prompt = None
+                    if not isinstance(prompt, str) or not prompt.strip():
+                        # Une ligne invalide n'interrompt pas l'import du reste du fichier
+                        print(f"⚠️ {path}:{line_no} ignorée : JSON sans clé 'prompt' exploitable.")
+                        continue
+                digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:12]
+                # Clé stable : empreinte du prompt + rang de cette occurrence (un prompt répété = plusieurs travaux).
+                # Relancer l'import après un crash ou après l'ajout de lignes ne recrée pas les travaux existants.
+                occurrences[digest] = occurrences.get(digest, 0) + 1
+                key = f"{digest}:{occurrences[digest]}"
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO jobs (job_key, prompt, created) VALUES (?, ?, ?)",
+                    (key, prompt, time.time()))
+                added += cursor.rowcount
+        self.conn.commit()
+        return added
+
+    def recover(self):
+        """Après un crash : les travaux interrompus reprennent à leur dernière étape terminée."""
+        self.conn.execute("UPDATE jobs SET status = 'pending' WHERE status = 'generating'")
+        self.conn.execute("UPDATE jobs SET status = 'generated' WHERE status = 'rendering'")
+        self.conn.commit()
+
+    def claim(self, status: str, new_status: str, limit: int) -> list:
+        if limit <= 0:
+            return []
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE status = ? AND next_run <= ? ORDER BY id LIMIT ?",
+            (status, time.time(), limit)).fetchall()
+        for row in rows:
+            self.conn.execute("UPDATE jobs SET status = ?, started = COALESCE(started, ?) WHERE id = ?",
+                              (new_status, time.time(), row["id"]))
+        self.conn.commit()
+        return rows
+
+    def set_status(self, job_id: int, status: str, **fields):
+        assignments = ", ".join(["status = ?"] + [f"{name} = ?" for name in fields])
+        self.conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (status, *fields.values(), job_id))
+        self.conn.commit()
+
+    def fail(self, job_id: int, error: str, max_attempts: int, backoff_base: float, retry_status: str = "pending"):
+        attempts = self.conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()[0] + 1
+        if attempts >= max_attempts:
+            self.set_status(job_id, "failed", attempts=attempts, error=error, finished=time.time())
+            print(f"❌ Travail {job_id} abandonné après {attempts} tentatives : {error}")
+        else:
+            delay = backoff_base * 2 ** (attempts - 1)
+            self.set_status(job_id, retry_status, attempts=attempts, error=error, next_run=time.time() + delay)
+            print(f"🔁 Travail {job_id} : échec ({error}), nouvel essai dans {delay:.0f}s.")
+
+    def counts(self) -> dict:
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def has_work(self) -> bool:
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'generating', 'generated', 'rendering')").fetchone()
+        return row[0] > 0
+
+    def throughput(self) -> float:
+        """Débit global en travaux par heure, entre le premier démarrage et la dernière fin."""
+        row = self.conn.execute(
+            "SELECT COUNT(*), MIN(started), MAX(finished) FROM jobs WHERE status = 'done'").fetchone()
+        done, first, last = row
+        if not done or last is None or last <= first:
+            return 0.0
+        return done / ((last - first) / 3600)
+
+
+# === Étapes exécutées dans les pools de travailleurs ===
+def generate_job(job_id: int, prompt: str, out_dir: str) -> str:
+    with span("batch.generate", job=job_id):
+        os.makedirs(out_dir, exist_ok=True)
+        code = patch_script(prompt_to_blender_code(prompt))
+        script_path = os.path.join(out_dir, SCRIPT_FILENAME)
+        save_script(code, script_path)
+        return script_path
+
+
+def render_job(job_id: int, out_dir: str) -> bool:
+    with span("batch.render", job=job_id):
+        script_path = os.path.join(out_dir, SCRIPT_FILENAME)
+        with open(os.path.join(out_dir, "blender.log"), "w", encoding="utf-8") as log:
+            run_blender_script(os.path.abspath(script_path), log)
+        # patch_script écrit le rendu dans <dossier du script>/renders/
+        return validate_scene(os.path.abspath(os.path.join(out_dir, "renders", RENDER_FILENAME)))
+
+
+def run(queue: JobQueue, output_dir: str = OUTPUT_DIR, llm_workers: int = 2, render_workers: int = 1,
+        max_attempts: int = MAX_ATTEMPTS, backoff_base: float = BACKOFF_BASE, report_every: float = 60):
+    queue.recover()
+    start = time.time()
+    done_this_run = 0
+    last_report = start
+    running = {}  # future -> (étape, id du travail)
+
+    with ThreadPoolExecutor(llm_workers, thread_name_prefix="llm") as llm_pool, \
+            ThreadPoolExecutor(render_workers, thread_name_prefix="render") as render_pool:
+        while True:
+            busy_llm = sum(1 for stage, _ in running.values() if stage == "generate")
+            busy_render = len(running) - busy_llm
+
+            for job in queue.claim("pending", "generating", llm_workers - busy_llm):
+                out_dir = os.path.join(output_dir, f"job_{job['id']:05d}")
+                queue.set_status(job["id"], "generating", out_dir=out_dir)
+                future = llm_pool.submit(generate_job, job["id"], job["prompt"], out_dir)
+                running[future] = ("generate", job["id"])
+
+            for job in queue.claim("generated", "rendering", render_workers - busy_render):
+                future = render_pool.submit(render_job, job["id"], job["out_dir"])
+                running[future] = ("render", job["id"])
+
+            if not running:
+                if not queue.has_work():
+                    break
+                time.sleep(1)  # Travaux en attente de leur délai de nouvel essai
+                continue
+
+            finished, _ = wait(list(running), timeout=1, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, job_id = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Une erreur de rendu (Blender, disque...) relance le rendu du script existant, sans le régénérer
+                    retry_status = "generated" if stage == "render" else "pending"
+                    queue.fail(job_id, f"{stage} : {e}", max_attempts, backoff_base, retry_status)
+                    continue
+
+                if stage == "generate":
+                    queue.set_status(job_id, "generated")
+                elif result:
+                    queue.set_status(job_id, "done", finished=time.time(), error=None)
+                    done_this_run += 1
+                    print(f"✅ Travail {job_id} terminé.")
+                else:
+                    # Scène invalide : on régénère un nouveau script
+                    queue.fail(job_id, "scène invalide", max_attempts, backoff_base)
+
+            if time.time() - last_report >= report_every:
+                last_report = time.time()
+                report(queue, done_this_run, start)
+
+    report(queue, done_this_run, start)
+
+
+def report(queue: JobQueue, done_this_run: int, start: float):
+    hours = (time.time() - start) / 3600
+    rate = done_this_run / hours if hours else 0.0
+    print(f"📊 {queue.counts()} | cette exécution : {done_this_run} terminés, {rate:.1f} travaux/heure "
+          f"| global : {queue.throughput():.1f} travaux/heure")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génération de scènes Blender par lots (file SQLite persistante).")
+    parser.add_argument("prompts", nargs="?", help="fichier de prompts à ajouter à la file (texte ou JSONL)")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    parser.add_argument("--llm-workers", type=int, default=2)
+    parser.add_argument("--render-workers", type=int, default=1)
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+    parser.add_argument("--backoff", type=float, default=BACKOFF_BASE, help="délai initial avant nouvel essai (s)")
+    parser.add_argument("--status", action="store_true", help="affiche l'état de la file sans rien lancer")
+    args = parser.parse_args()
+
+    job_queue = JobQueue(args.db)
+    if args.prompts:
+        print(f"📥 {job_queue.enqueue_file(args.prompts)} nouveau(x) travail(aux) ajouté(s).")
+    if args.status:
+        print(f"📊 {job_queue.counts()} | global : {job_queue.throughput():.1f} travaux/heure")
+    else:
+        run(job_queue, args.output, args.llm_workers, args.render_workers, args.max_attempts, args.backoff)
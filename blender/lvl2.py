@@ -10,7 +10,7 @@ def prompt_to_blender_code(prompt: str) -> str:
     if not mistral_api_key:
         raise ValueError("❌ Clé API Mistral manquante. Vérifie ton fichier .env")
 
-    url = "https://api.mistral.ai/v1/chat/completions"
+    url = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")
     headers = {
         "Authorization": f"Bearer {mistral_api_key}",
         "Content-Type": "application/json"
@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+from validator import validate_scene
+
+from tracing import traced, current_span
+
+HASH_SIZE = 8      # Empreinte de 8x8 = 64 bits
+DCT_SIZE = 32      # Image réduite à 32x32 avant la DCT
+MAX_DISTANCE = 6   # Distance de Hamming en dessous de laquelle deux rendus sont "identiques"
+COLOR_LEVELS = 4   # Histogramme RGB grossier : 4 niveaux par canal = 64 cases
+COLOR_SIZE = 64    # Image réduite à 64x64 pour l'histogramme
+MAX_COLOR_DISTANCE = 0.05  # Écart L1 maximal entre histogrammes normalisés
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)
+    matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+    matrix[0] /= np.sqrt(2)
+    return matrix * np.sqrt(2 / n)
+
+
+_DCT = _dct_matrix(DCT_SIZE)
+
+
+def perceptual_hash(img: Image.Image) -> int:
+    """pHash : DCT de l'image en niveaux de gris 32x32, basses fréquences comparées à leur médiane."""
+    small = img.convert("L").resize((DCT_SIZE, DCT_SIZE), Image.BILINEAR)
+    pixels = np.asarray(small, dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].flatten()
+    bits = low > np.median(low[1:])
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def color_histogram(img: Image.Image) -> np.ndarray:
+    """Proportion des pixels par case RGB : le pHash en niveaux de gris ignore les couleurs vérifiées par le validateur."""
+    small = np.asarray(img.convert("RGB").resize((COLOR_SIZE, COLOR_SIZE), Image.BILINEAR))
+    levels = (small // (256 // COLOR_LEVELS)).reshape(-1, 3).astype(np.int64)
+    bins = (levels[:, 0] * COLOR_LEVELS + levels[:, 1]) * COLOR_LEVELS + levels[:, 2]
+    return np.bincount(bins, minlength=COLOR_LEVELS ** 3) / len(bins)
+
+
+def render_signature(image_path: str) -> tuple:
+    with Image.open(image_path) as img:
+        return perceptual_hash(img), color_histogram(img)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class RenderIndex:
+    """
+    Index des rendus refusés pendant une exécution de l'agent (empreinte perceptuelle + couleurs) :
+    - Un rendu quasi identique à un échec réutilise ce verdict sans relancer validate_scene ;
+      un rendu proche d'un succès est toujours revalidé
+    - Compte les échecs consécutifs sur la même scène pour détecter une boucle bloquée
+    L'index vit en mémoire : il ne survit pas à l'exécution, ni à un changement de prompt ou de seuils.
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE, max_color_distance: float = MAX_COLOR_DISTANCE):
+        self.max_distance = max_distance
+        self.max_color_distance = max_color_distance
+        self.failures = []
+        self.failure_streak = 0
+        self._last_failure = None
+
+    def _same(self, a: tuple, b: tuple) -> bool:
+        return (hamming(a[0], b[0]) <= self.max_distance
+                and np.abs(a[1] - b[1]).sum() <= self.max_color_distance)
+
+    def lookup(self, signature: tuple) -> bool:
+        """Vrai si le rendu est quasi identique à un échec déjà analysé."""
+        return any(self._same(signature, failure) for failure in self.failures)
+
+    @traced("render_index.validate")
+    def validate(self, image_path: str) -> bool:
+        # Même résolution de chemin que validate_scene
+        full_path = image_path if os.path.isabs(image_path) else os.path.join("renders", image_path)
+        if not os.path.exists(full_path):
+            return validate_scene(image_path)
+
+        signature = render_signature(full_path)
+        cached = self.lookup(signature)
+        current_span().set("cache_hit", cached)
+        if cached:
+            valid = False
+            print("♻️ Rendu quasi identique à un échec déjà analysé : verdict réutilisé (invalide).")
+        else:
+            valid = validate_scene(image_path)
+            if not valid:
+                self.failures.append(signature)
+
+        self._track(signature, valid)
+        return valid
+
+    def _track(self, signature: tuple, valid: bool):
+        if valid:
+            self.failure_streak = 0
+            self._last_failure = None
+        elif self._last_failure is not None and self._same(signature, self._last_failure):
+            self.failure_streak += 1
+        else:
+            self.failure_streak = 1
+        if not valid:
+            self._last_failure = signature
+
+    def is_stuck(self, repeats: int = 2) -> bool:
+        """Vrai si les `repeats` derniers rendus sont le même échec."""
+        return self.failure_streak >= repeats
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+import batch_runner
+from batch_runner import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    job_queue = JobQueue(str(tmp_path / "jobs.sqlite"))
+    yield job_queue
+    job_queue.conn.close()
+
+
+def write_prompts(tmp_path, lines, name="prompts.txt"):
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def statuses(queue):
+    return [row["status"] for row in queue.conn.execute("SELECT status FROM jobs ORDER BY id")]
+
+
+def test_enqueue_is_stable_when_lines_move(queue, tmp_path):
+    assert queue.enqueue_file(write_prompts(tmp_path, ["forêt", "rivière", "forêt"])) == 3
+    # Ligne ajoutée en tête : seuls les nouveaux prompts (ou occurrences) sont ajoutés
+    path = write_prompts(tmp_path, ["# commentaire", "désert", "forêt", "rivière", "forêt", "forêt"])
+    assert queue.enqueue_file(path) == 2
+    assert queue.enqueue_file(path) == 0
+
+
+def test_enqueue_skips_jsonl_lines_without_prompt(queue, tmp_path, capsys):
+    path = write_prompts(tmp_path, ['{"prompt": "forêt"}', '{"texte": "rivière"}', '{pas du json', '{"prompt": "désert"}'],
+                         name="prompts.jsonl")
+    assert queue.enqueue_file(path) == 2
+    assert [row["prompt"] for row in queue.conn.execute("SELECT prompt FROM jobs ORDER BY id")] == ["forêt", "désert"]
+    assert "prompts.jsonl:2" in capsys.readouterr().out
+
+
+def test_claim_and_recover(queue, tmp_path):
+    queue.enqueue_file(write_prompts(tmp_path, ["a", "b", "c"]))
+    assert len(queue.claim("pending", "generating", 2)) == 2
+    job_id = queue.claim("pending", "generating", 5)[0]["id"]
+    queue.set_status(job_id, "rendering")
+    assert statuses(queue) == ["generating", "generating", "rendering"]
+
+    queue.recover()
+    assert statuses(queue) == ["pending", "pending", "generated"]
+    assert queue.has_work()
+
+
+def test_fail_retries_with_backoff_then_gives_up(queue, tmp_path):
+    queue.enqueue_file(write_prompts(tmp_path, ["a"]))
+    job_id = queue.claim("pending", "rendering", 1)[0]["id"]
+
+    before = time.time()
+    queue.fail(job_id, "render : crash", max_attempts=3, backoff_base=10, retry_status="generated")
+    row = queue.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    assert (row["status"], row["attempts"], row["error"]) == ("generated", 1, "render : crash")
+    assert before + 10 <= row["next_run"] <= time.time() + 10
+    # En attente de son délai : pas encore réclamable
+    assert queue.claim("generated", "rendering", 1) == []
+
+    queue.fail(job_id, "scène invalide", max_attempts=3, backoff_base=10)
+    row = queue.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    assert (row["status"], row["attempts"]) == ("pending", 2)
+    assert row["next_run"] >= before + 20
+
+    queue.fail(job_id, "scène invalide", max_attempts=3, backoff_base=10)
+    assert statuses(queue) == ["failed"]
+    assert not queue.has_work()
+
+
+def test_run_retries_render_errors_without_regenerating(queue, tmp_path, monkeypatch):
+    queue.enqueue_file(write_prompts(tmp_path, ["crash puis ok", "invalide puis ok"]))
+    generated, renders = [], []
+    render_results = {1: [RuntimeError("blender"), True], 2: [False, True]}
+
+    def fake_generate(job_id, prompt, out_dir):
+        generated.append(job_id)
+        return out_dir
+
+    def fake_render(job_id, out_dir):
+        renders.append(job_id)
+        result = render_results[job_id].pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(batch_runner, "generate_job", fake_generate)
+    monkeypatch.setattr(batch_runner, "render_job", fake_render)
+    batch_runner.run(queue, str(tmp_path / "out"), backoff_base=0, report_every=3600)
+
+    assert statuses(queue) == ["done", "done"]
+    # Erreur de rendu : même script rendu à nouveau ; scène invalide : script régénéré
+    assert sorted(generated) == [1, 2, 2]
+    assert sorted(renders) == [1, 1, 2, 2]
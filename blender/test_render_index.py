@@ -0,0 +1,85 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+import render_index
+from render_index import RenderIndex, render_signature, hamming
+
+
+def scene(path, ground=(60, 150, 60), river=(40, 80, 200), seed=0, noise=4):
+    """Rendu synthétique : sol, rivière verticale, tronc sombre, léger bruit."""
+    rng = np.random.default_rng(seed)
+    img = np.empty((128, 128, 3), dtype=np.int16)
+    img[:] = ground
+    img[:, 50:78] = river
+    img[30:70, 10:16] = (20, 15, 10)
+    img += rng.integers(-noise, noise + 1, size=img.shape, dtype=np.int16)
+    Image.fromarray(np.clip(img, 0, 255).astype(np.uint8)).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def verdicts(monkeypatch):
+    """Remplace validate_scene : renvoie les verdicts prévus et compte les appels."""
+    calls = []
+    planned = []
+
+    def fake_validate(image_path):
+        calls.append(image_path)
+        return planned.pop(0)
+
+    monkeypatch.setattr(render_index, "validate_scene", fake_validate)
+    return planned, calls
+
+
+def test_noisy_copy_is_a_near_duplicate(tmp_path):
+    index = RenderIndex()
+    a = render_signature(scene(tmp_path / "a.png", seed=0))
+    b = render_signature(scene(tmp_path / "b.png", seed=1))
+    assert hamming(a[0], b[0]) <= index.max_distance
+    assert index._same(a, b)
+
+
+def test_colour_change_is_not_a_duplicate(tmp_path):
+    # Rivière grise de même luminance : le pHash en niveaux de gris ne voit pas la différence
+    grey = round(0.299 * 40 + 0.587 * 80 + 0.114 * 200)
+    a = render_signature(scene(tmp_path / "a.png"))
+    b = render_signature(scene(tmp_path / "b.png", river=(grey, grey, grey)))
+    assert hamming(a[0], b[0]) <= RenderIndex().max_distance
+    assert not RenderIndex()._same(a, b)
+
+
+def test_only_failures_are_reused(tmp_path, verdicts):
+    planned, calls = verdicts
+    index = RenderIndex()
+
+    planned[:] = [True, True]
+    assert index.validate(scene(tmp_path / "ok1.png", seed=0))
+    assert index.validate(scene(tmp_path / "ok2.png", seed=1))
+    assert len(calls) == 2  # Un succès est toujours revalidé
+
+    planned[:] = [False]
+    bad = dict(river=(60, 150, 60))
+    assert not index.validate(scene(tmp_path / "ko1.png", seed=2, **bad))
+    assert not index.validate(scene(tmp_path / "ko2.png", seed=3, **bad))
+    assert len(calls) == 3  # Le second échec quasi identique réutilise le verdict
+
+
+def test_failure_streak_and_is_stuck(tmp_path, verdicts):
+    planned, _ = verdicts
+    index = RenderIndex()
+    bad = dict(river=(60, 150, 60))
+
+    planned[:] = [False]
+    index.validate(scene(tmp_path / "ko1.png", seed=0, **bad))
+    assert index.failure_streak == 1 and not index.is_stuck(2)
+    index.validate(scene(tmp_path / "ko2.png", seed=1, **bad))
+    assert index.failure_streak == 2 and index.is_stuck(2)
+
+    # Un échec différent repart de 1, un succès remet à zéro
+    planned[:] = [False, True]
+    index.validate(scene(tmp_path / "other.png", ground=(200, 40, 40), river=(200, 40, 40)))
+    assert index.failure_streak == 1
+    index.validate(scene(tmp_path / "ok.png"))
+    assert index.failure_streak == 0 and not index.is_stuck(1)
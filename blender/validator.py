@@ -2,7 +2,10 @@ import os
 from PIL import Image
 import numpy as np
 
+from tracing import traced, current_span
 
+
+@traced("validator.validate_scene")
 def validate_scene(image_path: str) -> bool:
     """
     Analyse l'image rendue pour valider la scène Blender :
@@ -18,11 +21,14 @@ def validate_scene(image_path: str) -> bool:
         print(f"❌ Aucune image de rendu trouvée à {image_path}.")
         return False
 
+    current_span().set("bytes", os.path.getsize(image_path))
+
     try:
         with Image.open(image_path) as img:
             img = img.convert("RGB")
             data = np.array(img)
             pixels = data.reshape((-1, 3))
+            current_span().set("pixels", len(pixels))
 
             # Vérifie que l’image n’est pas trop uniforme (échec de rendu typique)
             std_devs = np.std(pixels, axis=0)
@@ -68,6 +74,7 @@ def validate_scene(image_path: str) -> bool:
         return False
 
 
+@traced("validator.count_color_range")
 def count_color_range(pixels, lower, upper):
     """Compte le nombre de pixels dans une plage de couleurs (RGB)"""
     lower = np.array(lower, dtype=np.uint8)
@@ -0,0 +1,2 @@
+# Présent à la racine pour que pytest y ajoute le dépôt au chemin d'import :
+# les tests importent le module tracing comme les points d'entrée.
@@ -1,14 +1,18 @@
 import requests
-import json
 import subprocess
 import os
-import re
+import sys
+
+# Point d'entrée : le module tracing est à la racine du dépôt
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tool_calls import iter_tool_calls, iter_stream_content
+from tracing import traced, span, TracedIterator
 
 # === Paramètres API ===
 from dotenv import load_dotenv
 load_dotenv()
 API_KEY = os.getenv("MISTRAL_API_KEY")
-API_URL = "https://api.mistral.ai/v1/chat/completions"
+API_URL = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")
 HEADERS = {
     "Authorization": f"Bearer {API_KEY}",
     "Content-Type": "application/json"
@@ -33,6 +37,7 @@ def writeFile(path, content):
         f.write(content)
     print(f"[OK] Fichier écrit : {path}")
 
+@traced("script.launch_python_file")
 def launchPythonFile(path):
     print(f"[INFO] Exécution de : {path}")
     subprocess.run(["python", path], check=True)
@@ -41,33 +46,41 @@ def stop():
     print("[AGENT] Arrêt demandé.")
     return "STOP"
 
-# === Envoi d’un prompt à Mistral ===
-def generateText(prompt: str) -> str:
+# === Envoi d’un prompt à Mistral (réponse en streaming) ===
+def generateText(prompt: str):
     history.append({"role": "user", "content": prompt})
-    response = requests.post(API_URL, headers=HEADERS, json={
-        "model": "mistral-small",
-        "messages": history
-    })
-    response.raise_for_status()
-    content = response.json()["choices"][0]["message"]["content"]
-    history.append({"role": "assistant", "content": content})
-    return content
+    # Connexion + temps jusqu'au premier octet
+    with span("mistral.request", model="mistral-small"):
+        response = requests.post(API_URL, headers=HEADERS, stream=True, json={
+            "model": "mistral-small",
+            "messages": history,
+            "stream": True
+        })
+        response.raise_for_status()
+    # Seul le temps d'attente des morceaux est mesuré, pas l'exécution des actions entre deux morceaux
+    stream = TracedIterator("mistral.generate_stream", iter_stream_content(response), model="mistral-small")
+    parts = []
+    try:
+        for chunk in stream:
+            parts.append(chunk)
+            yield chunk
+    finally:
+        response.close()
+        content = "".join(parts)
+        stream.span.set("chunks", len(parts))
+        stream.span.set("bytes", len(content.encode("utf-8")))
+        stream.finish()
+        history.append({"role": "assistant", "content": content})
 
 # === Analyse + exécution de la réponse JSON ===
-def execute_instructions(response: str):
-    response = response.replace("\\_", "_")
-    try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
-        match = re.search(r'\[.*\]', response, re.DOTALL)
-        if match:
-            data = json.loads(match.group())
-        else:
-            raise ValueError("Impossible de parser la réponse du LLM.")
-
-    for action in data:
-        func_name = action["function_name"]
-        args = action["arguments"]
+@traced("script.execute_instructions")
+def execute_instructions(response):
+    # Chaque action est exécutée dès que son objet JSON est complet
+    found = False
+    for action in iter_tool_calls(response):
+        found = True
+        func_name = action.get("function_name")
+        args = action.get("arguments", {})
 
         match func_name:
             case "writeFile":
@@ -79,6 +92,9 @@ def execute_instructions(response: str):
             case _:
                 print(f"[WARN] Fonction inconnue : {func_name}")
 
+    if not found:
+        raise ValueError("Impossible de parser la réponse du LLM.")
+
 # === Agent multi-étapes avec boucle ===
 def run_agent(initial_prompt: str, max_step: int = 5):
     print("[AGENT] Démarrage de l’agent...\n")
@@ -86,9 +102,10 @@ def run_agent(initial_prompt: str, max_step: int = 5):
 
     for step in range(max_step):
         print(f"[STEP {step + 1}] Prompt envoyé à Mistral...")
-        response = generateText(user_prompt)
-        print("[LLM RESPONSE] ", response)
-        result = execute_instructions(response)
+        stream = generateText(user_prompt)
+        result = execute_instructions(stream)
+        stream.close()
+        print("[LLM RESPONSE] ", history[-1]["content"])
 
         if result == "STOP":
             print("[AGENT] Exécution terminée.")
@@ -1,14 +1,19 @@
 import requests
-import json
 import subprocess
 import os
-import re
+import sys
 from dotenv import load_dotenv
 
+# Point d'entrée : le module tracing est à la racine du dépôt
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from workspace import Workspace
+from tool_calls import find_tool_call
+from tracing import traced, current_span
+
 # === Chargement de la clé API ===
 load_dotenv()
 API_KEY = os.getenv("MISTRAL_API_KEY")
-API_URL = "https://api.mistral.ai/v1/chat/completions"
+API_URL = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")
 HEADERS = {
     "Authorization": f"Bearer {API_KEY}",
     "Content-Type": "application/json"
@@ -24,11 +29,15 @@ history = [
 ]
 
 # === Fonctions utilitaires ===
-def writeFile(path, content):
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+def writeFile(path, content, workspace=None):
+    if workspace is not None:
+        path = workspace.write_file(path, content)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
     print(f"[OK] Fichier écrit : {path}")
 
+@traced("script.run_tests")
 def runTests(path="."):
     print(f"[INFO] Lancement des tests avec pytest dans {path}")
     # On capture la sortie pour plus de clarté si besoin, mais ici simple run
@@ -38,21 +47,8 @@ def stop():
     print("[AGENT] Arrêt demandé par l'agent.")
     return "STOP"
 
-def cleanup_old_generated_files():
-    # Supprime les anciens fichiers tests et fonctions générés (test_generated*.py, *.py générés)
-    removed = False
-    for f in os.listdir():
-        if re.match(r"test_generated(_\d+)?\.py", f) or re.match(r"[a-zA-Z0-9_]+\.py", f) and f not in ["run_agent.py"]:
-            try:
-                os.remove(f)
-                print(f"[CLEANUP] {f} supprimé.")
-                removed = True
-            except Exception as e:
-                print(f"[WARN] Impossible de supprimer {f} : {e}")
-    if not removed:
-        print("[CLEANUP] Aucun fichier à supprimer.")
-
 # === Appel à l’API LLM ===
+@traced("mistral.generate")
 def generateText(user_prompt: str) -> str:
     history.append({"role": "user", "content": user_prompt})
     response = requests.post(API_URL, headers=HEADERS, json={
@@ -60,30 +56,31 @@ def generateText(user_prompt: str) -> str:
         "messages": history
     })
     response.raise_for_status()
-    content = response.json()["choices"][0]["message"]["content"]
+    payload = response.json()
+    usage = payload.get("usage", {})
+    current_span().set("prompt_tokens", usage.get("prompt_tokens"))
+    current_span().set("completion_tokens", usage.get("completion_tokens"))
+    current_span().set("bytes", len(response.content))
+    content = payload["choices"][0]["message"]["content"]
     history.append({"role": "assistant", "content": content})
     return content
 
 # === Interprétation du JSON généré par le LLM ===
-def execute_instructions(response: str):
-    response = response.replace("\\_", "_")
-
-    try:
-        data = json.loads(response)
-    except json.JSONDecodeError:
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        if match:
-            data = json.loads(match.group())
-        else:
-            raise ValueError("Impossible de parser la réponse du LLM.")
+INSTRUCTION_KEYS = ("functions", "tests", "run_tests", "stop")
 
-    cleanup_old_generated_files()
+
+@traced("script.execute_instructions")
+def execute_instructions(response: str, workspace: Workspace):
+    data = find_tool_call(response, INSTRUCTION_KEYS)
+
+    # Seuls les fichiers créés à l'étape précédente sont supprimés
+    workspace.clean()
 
     function_names = []
     for func in data.get("functions", []):
         name = func.get("name", "generated_function")
         code = func.get("code") or func.get("definition") or ""
-        writeFile(f"{name}.py", code)
+        writeFile(f"{name}.py", code, workspace)
         function_names.append(name)
 
     # === Regroupement des tests dans un seul fichier
@@ -105,17 +102,20 @@ def execute_instructions(response: str):
             print(f"[WARN] Format de test non reconnu : {test}")
 
     if test_code:
-        writeFile("test_generated.py", test_code)
+        writeFile("test_generated.py", test_code, workspace)
 
     if data.get("run_tests"):
-        runTests()
+        runTests(workspace.path)
 
     if data.get("stop"):
         return stop()
 
 # === Agent multi-étapes ===
-def run_agent(initial_prompt: str, max_step: int = 5):
+def run_agent(initial_prompt: str, max_step: int = 5) -> Workspace:
+    # L'espace de travail est renvoyé pour inspection : l'appelant le supprime avec workspace.close()
     print(f"[AGENT] Démarrage de l'agent pour {max_step} étapes maximum.")
+    workspace = Workspace()
+    print(f"[AGENT] Espace de travail : {workspace.path}")
     user_prompt = initial_prompt
 
     for step in range(max_step):
@@ -123,7 +123,8 @@ def run_agent(initial_prompt: str, max_step: int = 5):
         response = generateText(user_prompt)
         print("[LLM RESPONSE] ", response)
 
-        result = execute_instructions(response)
+        result = execute_instructions(response, workspace)
+        workspace.snapshot(step + 1)
         if result == "STOP":
             print("[AGENT] Fin de l'exécution.")
             break
@@ -132,9 +133,16 @@ def run_agent(initial_prompt: str, max_step: int = 5):
     else:
         print("[AGENT] Nombre d'étapes maximum atteint sans arrêt explicite.")
 
+    return workspace
+
 # === Point d’entrée principal ===
 if __name__ == "__main__":
-    run_agent("""
+    workspace = run_agent("""
 Crée une fonction Python nommée `add(a, b)` qui retourne leur somme.
 Écris un test unitaire associé, exécute-le, puis arrête-toi quand c'est bon.
 """, max_step=5)
+    # KEEP_WORKSPACE=1 pour conserver les fichiers générés et les snapshots
+    if os.getenv("KEEP_WORKSPACE") == "1":
+        print(f"[AGENT] Espace de travail conservé : {workspace.base_dir}")
+    else:
+        workspace.close()
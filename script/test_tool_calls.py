@@ -0,0 +1,56 @@
+import time
+
+import pytest
+
+from tool_calls import ToolCallParser, parse_tool_calls, find_tool_call
+
+
+def test_parse_multiple_blocks():
+    response = 'Voici :\n```json\n[{"function_name": "stop", "arguments": {}}]\n```\nPuis {"a": "}"}'
+    calls = parse_tool_calls(response)
+    assert calls == [{"function_name": "stop", "arguments": {}}, {"a": "}"}]
+
+
+def test_streamed_chunks_emit_on_close():
+    parser = ToolCallParser()
+    assert parser.feed('[{"function_name": "write\\_File", "argu') == []
+    assert parser.feed('ments": {"path": "a.py"}}, {"x"') == [
+        {"function_name": "write_File", "arguments": {"path": "a.py"}}
+    ]
+    assert parser.feed(': 1}]') == [{"x": 1}]
+
+
+def test_resync_after_stray_brace():
+    response = 'Utilise un dict { ... puis :\n[{"function_name": "stop", "arguments": {}}]'
+    assert parse_tool_calls(response) == [{"function_name": "stop", "arguments": {}}]
+
+
+def test_resync_after_balanced_prose():
+    response = 'Le format {nom: valeur} est attendu : {"function_name": "stop", "arguments": {}}'
+    assert parse_tool_calls(response) == [{"function_name": "stop", "arguments": {}}]
+
+
+def test_valid_object_inside_invalid_one_is_emitted():
+    response = '{ note : {"function_name": "stop", "arguments": {}} } fin'
+    assert parse_tool_calls(response) == [{"function_name": "stop", "arguments": {}}]
+
+
+def test_stray_quote_only_hides_its_line():
+    response = 'Exemple { "a\n{"function_name": "stop", "arguments": {}}'
+    assert parse_tool_calls(response) == [{"function_name": "stop", "arguments": {}}]
+
+
+def test_many_stray_braces_scan_in_linear_time():
+    call = '{"function_name": "stop", "arguments": {}}'
+    # Une relecture par accolade parasite prendrait plusieurs minutes à cette taille
+    for prefix in ("{ a ", "{ ", "{ a } "):
+        start = time.perf_counter()
+        assert parse_tool_calls(prefix * 50_000 + call) == [{"function_name": "stop", "arguments": {}}]
+        assert time.perf_counter() - start < 5
+
+
+def test_find_tool_call_skips_format_examples():
+    response = 'Format attendu : {"name": "add"}. Réponse : {"functions": [], "stop": true}'
+    assert find_tool_call(response, ("functions", "tests", "run_tests", "stop")) == {"functions": [], "stop": True}
+    with pytest.raises(ValueError):
+        find_tool_call('{"name": "add"}', ("functions", "stop"))
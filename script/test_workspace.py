@@ -0,0 +1,65 @@
+import os
+import stat
+
+import pytest
+
+from workspace import Workspace, FILE_MODE
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = Workspace(str(tmp_path / "ws"))
+    yield ws
+    ws.close()
+
+
+def test_clean_only_removes_manifest_files(workspace):
+    workspace.write_file("add.py", "x = 1")
+    other = os.path.join(workspace.path, "unrelated.py")
+    with open(other, "w") as f:
+        f.write("keep")
+
+    workspace.clean()
+
+    assert not os.path.exists(os.path.join(workspace.path, "add.py"))
+    assert os.path.exists(other)
+    assert workspace.manifest == set()
+
+
+def test_written_files_use_default_permissions(workspace):
+    path = workspace.write_file("add.py", "x = 1")
+    assert stat.S_IMODE(os.stat(path).st_mode) == FILE_MODE
+
+
+def test_snapshot_rollback_and_diff(workspace):
+    workspace.write_file("add.py", "v1")
+    workspace.snapshot(1)
+    workspace.write_file("add.py", "v2")
+    workspace.write_file("test_generated.py", "t")
+    workspace.snapshot(2)
+
+    assert workspace.diff(1, 2) == {"added": ["test_generated.py"], "removed": [], "modified": ["add.py"]}
+
+    workspace.rollback(1)
+    with open(os.path.join(workspace.path, "add.py")) as f:
+        assert f.read() == "v1"
+    assert workspace.manifest == {"add.py"}
+    assert workspace.diff(1) == {"added": [], "removed": [], "modified": []}
+
+
+def test_path_outside_workspace_is_rejected(workspace):
+    with pytest.raises(ValueError):
+        workspace.write_file("../evil.py", "x")
+
+
+def test_close_keeps_the_parent_directory(tmp_path):
+    existing = tmp_path / "keep.txt"
+    existing.write_text("keep")
+    ws = Workspace(str(tmp_path))
+    ws.write_file("add.py", "x = 1")
+
+    ws.close()
+
+    assert existing.read_text() == "keep"
+    assert not os.path.exists(ws.base_dir)
+    assert os.path.commonpath([str(tmp_path), ws.base_dir]) == str(tmp_path)
@@ -0,0 +1,210 @@
+import json
+import re
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_LITERALS = ("true", "false", "null")
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-.")
+_ESCAPES = frozenset('"\\/bfnrtu')
+
+
+class _Frame:
+    """Objet ou liste ouvert : position dans le tampon, attente grammaticale, objets valides retenus."""
+    __slots__ = ("kind", "start", "expect", "held")
+
+    def __init__(self, kind: str, start: int):
+        self.kind = kind
+        self.start = start
+        self.expect = "key_or_end" if kind == "{" else "value_or_end"
+        self.held = []  # (début, fin, objets internes) des objets valides qu'il contient
+
+
+class ToolCallParser:
+    """
+    Extracteur incrémental d'appels d'outils dans une réponse LLM :
+    - Consomme le texte par morceaux (streaming), en une seule passe linéaire
+    - Émet chaque objet JSON qui n'est pas imbriqué dans un autre objet valide dès que c'est décidable
+      (objet isolé, élément d'une liste, ou contenu dans une accolade parasite)
+    - Ignore le texte autour (prose, balises Markdown) et corrige les '\\_' dans les chaînes
+    - Une pile des accolades ouvertes, validée au fil de l'eau (grammaire JSON minimale), permet de
+      se resynchroniser après une '{' parasite sans relire le texte : les objets valides qu'elle contient
+      sont retenus puis émis dès qu'elle est reconnue invalide ou à la fin du flux
+    - Une chaîne ne peut pas contenir de retour à la ligne brut : un guillemet parasite ne masque qu'une ligne
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.buffer = []       # Caractères depuis la '{' ouverte la plus externe
+        self.stack = []        # Objets et listes ouverts
+        self.invalid_depth = 0  # Les `invalid_depth` premiers niveaux de la pile sont invalides
+        self.in_string = False
+        self.escape = False
+        self.token = []        # Littéral ou nombre en cours (hors chaîne)
+
+    def feed(self, chunk: str) -> list:
+        calls = []
+        for ch in chunk:
+            self._step(ch, calls)
+        return calls
+
+    def close(self) -> list:
+        """Fin du flux : les objets restés ouverts sont invalides, leurs objets valides sont émis."""
+        calls = []
+        for frame in self.stack[self.invalid_depth:]:
+            self._emit(frame.held, calls)
+        self._reset()
+        return calls
+
+    # === Validation ===
+    def _invalidate(self, calls: list):
+        # Un conteneur invalide rend invalides tous ceux qui l'entourent : les objets qu'ils
+        # retenaient ne peuvent plus être absorbés par un objet valide et sont émis
+        for frame in self.stack[self.invalid_depth:]:
+            self._emit(frame.held, calls)
+            frame.held = []
+        self.invalid_depth = len(self.stack)
+
+    def _expect_value(self, calls: list):
+        frame = self.stack[-1]
+        if frame.expect not in ("value", "value_or_end"):
+            self._invalidate(calls)
+        frame.expect = "comma_or_end"
+
+    def _end_token(self, calls: list):
+        token = "".join(self.token)
+        self.token = []
+        if token not in _LITERALS and not _NUMBER.fullmatch(token):
+            self._invalidate(calls)
+        self._expect_value(calls)
+
+    def _emit(self, candidates: list, calls: list):
+        for start, end, inner in candidates:
+            try:
+                calls.append(json.loads("".join(self.buffer[start:end])))
+            except json.JSONDecodeError:
+                # Cas non couvert par la validation (ex. '\\u' mal formé) : objets internes
+                self._emit(inner, calls)
+
+    # === Passe unique ===
+    def _step(self, ch: str, calls: list):
+        if not self.stack:
+            # Hors objet : seul un début d'objet compte
+            if ch == "{":
+                self.buffer = [ch]
+                self.stack.append(_Frame("{", 0))
+            return
+
+        if self.in_string:
+            if ch in "\r\n":
+                # Retour à la ligne brut : guillemet parasite, la chaîne s'arrête là
+                self.in_string = self.escape = False
+                self._invalidate(calls)
+            elif self.escape:
+                self.escape = False
+                if ch == "_":
+                    # '\_' n'est pas un échappement JSON valide
+                    self.buffer[-1] = "_"
+                    return
+                if ch not in _ESCAPES:
+                    self._invalidate(calls)
+            elif ch == "\\":
+                self.escape = True
+            elif ch == '"':
+                self.in_string = False
+            self.buffer.append(ch)
+            return
+
+        if ch in _TOKEN_CHARS:
+            self.token.append(ch)
+            self.buffer.append(ch)
+            return
+        if self.token:
+            self._end_token(calls)
+
+        self.buffer.append(ch)
+        frame = self.stack[-1]
+        if ch in " \t\r\n":
+            return
+        if ch == '"':
+            self.in_string = True
+            if frame.expect in ("key", "key_or_end"):
+                frame.expect = "colon"
+            else:
+                self._expect_value(calls)
+        elif ch == ":":
+            if frame.expect != "colon":
+                self._invalidate(calls)
+            frame.expect = "value"
+        elif ch == ",":
+            if frame.expect != "comma_or_end":
+                self._invalidate(calls)
+            frame.expect = "key" if frame.kind == "{" else "value"
+        elif ch in "{[":
+            self._expect_value(calls)
+            self.stack.append(_Frame(ch, len(self.buffer) - 1))
+        elif ch in "}]":
+            ends = ("key_or_end", "comma_or_end") if ch == "}" else ("value_or_end", "comma_or_end")
+            if frame.kind != ("{" if ch == "}" else "[") or frame.expect not in ends:
+                self._invalidate(calls)
+            self._close_frame(calls)
+        else:
+            self._invalidate(calls)
+
+    def _close_frame(self, calls: list):
+        depth = len(self.stack)
+        frame = self.stack.pop()
+        if depth <= self.invalid_depth:
+            # Conteneur invalide : ses objets valides ont déjà été émis ou remontent au parent
+            self.invalid_depth = len(self.stack)
+            candidates = frame.held
+        elif frame.kind == "{":
+            candidates = [(frame.start, len(self.buffer), frame.held)]
+        else:
+            candidates = frame.held  # Éléments d'une liste valide
+
+        if len(self.stack) == self.invalid_depth:
+            # Plus aucun conteneur valide autour : émission immédiate
+            self._emit(candidates, calls)
+            if not self.stack:
+                self._reset()
+        else:
+            self.stack[-1].held.extend(candidates)
+
+
+def iter_tool_calls(chunks):
+    """Itère sur les appels d'outils d'une réponse (str) ou d'un flux de morceaux."""
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    parser = ToolCallParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def parse_tool_calls(response: str) -> list:
+    calls = list(iter_tool_calls(response))
+    if not calls:
+        raise ValueError("Impossible de parser la réponse du LLM.")
+    return calls
+
+
+def find_tool_call(response: str, keys) -> dict:
+    """Premier objet de la réponse portant l'une des clés `keys` (ignore les exemples de format cités avant)."""
+    for call in iter_tool_calls(response):
+        if isinstance(call, dict) and any(key in call for key in keys):
+            return call
+    raise ValueError("Aucune instruction reconnue dans la réponse du LLM.")
+
+
+def iter_stream_content(response):
+    """Itère sur les morceaux de texte d'une réponse SSE de l'API chat/completions."""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        payload = line[len("data:"):].strip()
+        if payload == "[DONE]":
+            break
+        delta = json.loads(payload)["choices"][0].get("delta", {})
+        if delta.get("content"):
+            yield delta["content"]
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+
+# mkstemp crée les fichiers en 0600 : on rétablit les droits usuels (0666 moins l'umask)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+class Workspace:
+    """
+    Espace de travail isolé pour une session d'agent :
+    - Tous les fichiers générés sont écrits dans un dossier temporaire dédié
+    - Un manifeste garde la liste des fichiers créés (nettoyage en O(fichiers créés))
+    - Les snapshots d'étape sont des liens physiques (aucune copie de contenu)
+    """
+
+    def __init__(self, base_dir: str = None, prefix: str = "agent_ws_"):
+        # Toujours un sous-dossier neuf : close() ne supprime que ce que l'espace a créé
+        if base_dir:
+            os.makedirs(base_dir, exist_ok=True)
+        self.base_dir = tempfile.mkdtemp(prefix=prefix, dir=base_dir)
+        self.path = os.path.join(self.base_dir, "current")
+        self.snapshots_dir = os.path.join(self.base_dir, "snapshots")
+        os.makedirs(self.path, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        self.manifest = set()
+        self.snapshots = {}
+
+    def _resolve(self, rel_path: str) -> str:
+        full_path = os.path.normpath(os.path.join(self.path, rel_path))
+        if os.path.commonpath([self.path, full_path]) != self.path:
+            raise ValueError(f"Chemin hors de l'espace de travail : {rel_path}")
+        return full_path
+
+    def write_file(self, rel_path: str, content: str) -> str:
+        full_path = self._resolve(rel_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Écriture atomique via un nouveau fichier : les liens physiques des snapshots
+        # pointent toujours vers l'ancien contenu.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(full_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, full_path)
+        self.manifest.add(os.path.relpath(full_path, self.path))
+        return full_path
+
+    def clean(self):
+        # Supprime uniquement les fichiers du manifeste, sans lister le dossier
+        removed = 0
+        for rel_path in sorted(self.manifest):
+            try:
+                os.remove(os.path.join(self.path, rel_path))
+                removed += 1
+            except FileNotFoundError:
+                pass
+        self.manifest.clear()
+        print(f"[CLEANUP] {removed} fichier(s) supprimé(s) de l'espace de travail.")
+
+    def reset(self):
+        # Échange de dossier : l'ancien est renommé puis supprimé en une fois
+        trash = tempfile.mkdtemp(prefix="trash_", dir=self.base_dir)
+        os.replace(self.path, os.path.join(trash, "current"))
+        os.makedirs(self.path)
+        shutil.rmtree(trash, ignore_errors=True)
+        self.manifest.clear()
+
+    def snapshot(self, label) -> str:
+        label = str(label)
+        snap_path = os.path.join(self.snapshots_dir, label)
+        if os.path.exists(snap_path):
+            shutil.rmtree(snap_path)
+        for rel_path in self.manifest:
+            src = os.path.join(self.path, rel_path)
+            if not os.path.exists(src):
+                continue
+            dst = os.path.join(snap_path, rel_path)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.link(src, dst)
+        os.makedirs(snap_path, exist_ok=True)
+        self.snapshots[label] = {p for p in self.manifest if os.path.exists(os.path.join(snap_path, p))}
+        return snap_path
+
+    def rollback(self, label):
+        label = str(label)
+        if label not in self.snapshots:
+            raise KeyError(f"Snapshot inconnu : {label}")
+        self.reset()
+        snap_path = os.path.join(self.snapshots_dir, label)
+        for rel_path in self.snapshots[label]:
+            dst = os.path.join(self.path, rel_path)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.link(os.path.join(snap_path, rel_path), dst)
+        self.manifest = set(self.snapshots[label])
+
+    def diff(self, label_a, label_b=None) -> dict:
+        """
+        Compare deux snapshots (ou un snapshot et l'état courant si label_b est None).
+        Les fichiers partageant le même inode sont inchangés sans lecture du contenu.
+        """
+        files_a, root_a = self.snapshots[str(label_a)], os.path.join(self.snapshots_dir, str(label_a))
+        if label_b is None:
+            files_b, root_b = self.manifest, self.path
+        else:
+            files_b, root_b = self.snapshots[str(label_b)], os.path.join(self.snapshots_dir, str(label_b))
+
+        modified = []
+        for rel_path in sorted(files_a & files_b):
+            path_a, path_b = os.path.join(root_a, rel_path), os.path.join(root_b, rel_path)
+            if os.path.samefile(path_a, path_b):
+                continue
+            with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+                if fa.read() != fb.read():
+                    modified.append(rel_path)
+
+        return {
+            "added": sorted(files_b - files_a),
+            "removed": sorted(files_a - files_b),
+            "modified": modified,
+        }
+
+    def close(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
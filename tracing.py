@@ -0,0 +1,235 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import resource  # Indisponible sous Windows : pas de CPU des sous-processus
+except ImportError:
+    resource = None
+
+# === Configuration via variables d'environnement ===
+# TRACE_FILE    : chemin du fichier JSONL où écrire chaque span (désactivé si vide)
+# TRACE_PROFILE : "1" pour activer le profileur par échantillonnage
+# TRACE_SUMMARY : "0" pour ne pas afficher le résumé à la sortie
+TRACE_FILE = os.getenv("TRACE_FILE", "")
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats = {}
+_profiler = None
+
+
+class Span:
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, key: str, value):
+        self.attrs[key] = value
+
+    def add(self, key: str, value):
+        self.attrs[key] = self.attrs.get(key, 0) + value
+
+
+def _children_cpu() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _record(record: dict):
+    with _lock:
+        stats = _stats.setdefault(record["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "errors": 0})
+        stats["count"] += 1
+        stats["total_ms"] += record["duration_ms"]
+        stats["max_ms"] = max(stats["max_ms"], record["duration_ms"])
+        if "error" in record:
+            stats["errors"] += 1
+        if TRACE_FILE:
+            with open(TRACE_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Mesure le temps réel (et le CPU des sous-processus) d'un bloc de code."""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    current = Span(name, dict(attrs))
+    parent = stack[-1].name if stack else None
+    stack.append(current)
+
+    start_wall = time.time()
+    start = time.perf_counter()
+    start_cpu = _children_cpu()
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        # Retrait par identité : un span peut se fermer hors ordre (ex. threads, générateurs)
+        stack.remove(current)
+        _finish(current, start_wall, (time.perf_counter() - start) * 1000,
+                _children_cpu() - start_cpu, parent, error)
+
+
+def _finish(current: Span, start_wall: float, duration_ms: float, child_cpu: float, parent, error):
+    record = {
+        "name": current.name,
+        "start": start_wall,
+        "duration_ms": duration_ms,
+        "pid": os.getpid(),
+    }
+    if parent:
+        record["parent"] = parent
+    if child_cpu:
+        record["child_cpu_s"] = child_cpu
+    if error:
+        record["error"] = error
+    record.update(current.attrs)
+    _record(record)
+
+
+class TracedIterator:
+    """
+    Enveloppe un itérateur (ex. flux de l'API) en ne mesurant que le temps passé dans next() :
+    le travail fait par le consommateur entre deux éléments n'est pas compté.
+    Le span est enregistré une seule fois, par finish().
+    """
+
+    def __init__(self, name: str, iterable, **attrs):
+        self.span = Span(name, dict(attrs))
+        self.parent = current_span().name if current_span() else None
+        self._iterator = iter(iterable)
+        self._start_wall = time.time()
+        self._elapsed = 0.0
+        self._child_cpu = 0.0
+        self._items = 0
+        self._error = None
+        self._finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        start_cpu = _children_cpu()
+        try:
+            item = next(self._iterator)
+        except StopIteration:
+            raise
+        except BaseException as e:
+            self._error = type(e).__name__
+            raise
+        finally:
+            self._elapsed += time.perf_counter() - start
+            self._child_cpu += _children_cpu() - start_cpu
+        self._items += 1
+        return item
+
+    def finish(self):
+        if self._finished:
+            return
+        self._finished = True
+        self.span.attrs.setdefault("items", self._items)
+        _finish(self.span, self._start_wall, self._elapsed * 1000, self._child_cpu, self.parent, self._error)
+
+
+def traced(name=None):
+    """Décorateur : chaque appel de la fonction est enregistré comme un span."""
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    if callable(name):
+        func, name = name, None
+        return decorator(func)
+    return decorator
+
+
+def current_span():
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+# === Profileur par échantillonnage (optionnel) ===
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005, thread_id: int = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                code = frame.f_code
+                self.samples[f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"] += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def report(self, top: int = 15):
+        total = sum(self.samples.values())
+        if not total:
+            return
+        print(f"\n[PROFILE] {total} échantillons ({self.interval * 1000:.0f} ms)")
+        for location, count in self.samples.most_common(top):
+            print(f"  {count / total:6.1%}  {location}")
+
+
+def enable_profiler(interval: float = 0.005):
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler(interval).start()
+    return _profiler
+
+
+# === Résumé à la sortie ===
+def summary():
+    with _lock:
+        items = sorted(_stats.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    if not items:
+        return
+    print("\n[TRACE] Résumé des spans")
+    print(f"  {'span':<40} {'appels':>7} {'total ms':>11} {'moy ms':>9} {'max ms':>9}")
+    for name, s in items:
+        print(f"  {name:<40} {s['count']:>7} {s['total_ms']:>11.1f} "
+              f"{s['total_ms'] / s['count']:>9.1f} {s['max_ms']:>9.1f}"
+              + (f"  ({s['errors']} erreurs)" if s["errors"] else ""))
+
+
+def _at_exit():
+    if _profiler is not None:
+        _profiler.stop()
+        _profiler.report()
+    if os.getenv("TRACE_SUMMARY", "1") != "0":
+        summary()
+
+
+if os.getenv("TRACE_PROFILE") == "1":
+    enable_profiler()
+
+atexit.register(_at_exit)